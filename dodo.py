@@ -17,7 +17,9 @@ def task_tests():
     return {
         "actions": [
             "python -m unittest tests/test_controller.py",
+            "python -m unittest tests/test_database_gateway.py",
             "python -m unittest tests/test_telegram_controller.py",
+            "python -m unittest tests/test_telegram_keyboard_creator.py",
             "python -m unittest tests/test_zabbix_connector.py",
             "python -m unittest tests/test_zabbix_controller.py"
         ],
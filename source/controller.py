@@ -1,11 +1,13 @@
 """Controller module."""
+import asyncio
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Iterable
 
 from entities.monitoring_system_structure.host import Host
+from entities.monitoring_system_structure.host_group import HostGroup
 from entities.monitoring_system_structure.trigger import Trigger
 from entities.notification_sink import NotificationSink
-from entities.notification_sink_to_trigger import NotificationSinkToTrigger
 from monitoring_systems.abstract_monitoring_system_controller import AbstractMonitoringSystemController, MonitoringEvent
 from notifiers.abstract_notifier_controller import AbstractNotifierController, EventMessageComponents
 from outer_resources.database_gateway import DatabaseGateway
@@ -13,6 +15,25 @@ from outer_resources.database_gateway import DatabaseGateway
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class EntitiesFetchCache:
+    """In-flight entity fetches shared by events of one batch."""
+
+    trigger_id_to_trigger_origin: dict[int, asyncio.Task[tuple[Trigger, Host, list[HostGroup]]]] = field(
+        default_factory=dict
+    )
+
+    async def get_trigger_origin(
+            self,
+            trigger_id: int,
+            fetcher: Callable[[int], Awaitable[tuple[Trigger, Host, list[HostGroup]]]],
+    ) -> tuple[Trigger, Host, list[HostGroup]]:
+        """Fetch trigger origin once per trigger, sharing in-flight fetch between callers."""
+        if (task := self.trigger_id_to_trigger_origin.get(trigger_id)) is None:
+            task = self.trigger_id_to_trigger_origin[trigger_id] = asyncio.create_task(fetcher(trigger_id))
+        return await asyncio.shield(task)
+
+
 class Controller:
     """Main logic class."""
 
@@ -22,20 +43,36 @@ class Controller:
 
         database_gateway: DatabaseGateway
         monitoring_system_controller: AbstractMonitoringSystemController
-        notifier_controller: AbstractNotifierController
+        notifier_controller: AbstractNotifierController | None
 
     def __init__(self, context: Context) -> None:
         """init."""
         self.context = context
+        self._events_handling_lock = asyncio.Lock()
         logger.info(f"{type(self).__name__} inited")
 
-    async def handle_monitoring_events(self, events: list[MonitoringEvent]) -> None:
-        """Handle current monitoring events sequentially."""
-        for event in events:
-            try:
-                await self._handle_monitoring_event(event)
-            except Exception as e:
-                logger.error(f"Monitoring event handling failed: {repr(e)}")
+    async def handle_monitoring_events(self, events: Iterable[MonitoringEvent]) -> None:
+        """Handle current monitoring events concurrently."""
+        events = tuple(events)
+        if not events or self.context.notifier_controller is None:
+            return
+
+        async with self._events_handling_lock:
+            await self._handle_monitoring_events(events)
+
+    async def _handle_monitoring_events(self, events: tuple[MonitoringEvent, ...]) -> None:
+        """Handle monitoring events batch."""
+        trigger_id_to_notification_sinks = await self.context.database_gateway.get_notification_sinks_by_trigger_ids(
+            {event.trigger_id for event in events}
+        )
+        entities_fetch_cache = EntitiesFetchCache()
+        async with asyncio.TaskGroup() as task_group:
+            for event in events:
+                task_group.create_task(
+                    self._guarded_handle_monitoring_event(
+                        event, trigger_id_to_notification_sinks[event.trigger_id], entities_fetch_cache
+                    )
+                )
 
     async def get_unresolved_events(self, notification_sink: NotificationSink) -> list[MonitoringEvent]:
         """Get current raised events."""
@@ -55,40 +92,52 @@ class Controller:
         notification_sink = await self.context.database_gateway.get_notification_sink(recipient_id)
 
         actual_triggers = await self.context.monitoring_system_controller.get_triggers()
-        saved_triggers = await self.context.database_gateway.get_triggers_by_notification_sink_id(
-            notification_sink.id,
+        return await self.context.database_gateway.insert_missing_notification_sink_to_triggers(
+            notification_sink.id, [trigger.id for trigger in actual_triggers],
         )
-        notification_sink_to_triggers = [
-            NotificationSinkToTrigger(notification_sink.id, trigger_id)
-            for trigger_id in {trigger.id for trigger in actual_triggers} - {trigger.id for trigger in saved_triggers}
-        ]
-        await self.context.database_gateway.insert(notification_sink_to_triggers)
-        return len(notification_sink_to_triggers)
 
     async def unsubscribe_to_monitoring_system_triggers(self, recipient_id: str) -> None:
         """Unsubscribe user from all monitoring system triggers."""
         notification_sink = await self.context.database_gateway.get_notification_sink(recipient_id)
         await self.context.database_gateway.delete_notification_sink_to_trigger(notification_sink.id)
 
-    async def _handle_monitoring_event(self, event: MonitoringEvent) -> None:
+    async def _guarded_handle_monitoring_event(
+            self,
+            event: MonitoringEvent,
+            notification_sinks: list[NotificationSink],
+            entities_fetch_cache: EntitiesFetchCache,
+    ) -> None:
+        """Handle monitoring event without affecting other events handling."""
+        try:
+            await self._handle_monitoring_event(event, notification_sinks, entities_fetch_cache)
+        except Exception as e:
+            logger.error(f"Monitoring event handling failed: {repr(e)}")
+
+    async def _handle_monitoring_event(
+            self,
+            event: MonitoringEvent,
+            notification_sinks: list[NotificationSink],
+            entities_fetch_cache: EntitiesFetchCache,
+    ) -> None:
         """Notify users about monitoring event."""
         logger.debug(f"Handling {event}")
-        notification_sinks_to_notify = await self.context.database_gateway.get_notification_sinks_by_trigger_id(
-            event.trigger_id,
-        )
-        if not notification_sinks_to_notify:
+        if not notification_sinks:
             return
 
         if event.resolved_at is None:
-            await self._notify_about_raised_event(notification_sinks_to_notify, event)
+            await self._notify_about_raised_event(notification_sinks, event, entities_fetch_cache)
         else:
-            await self._notify_about_resolved_event(notification_sinks_to_notify, event)
+            await self._notify_about_resolved_event(notification_sinks, event, entities_fetch_cache)
 
-    async def _get_event_message_components(self, event: MonitoringEvent) -> EventMessageComponents:
+    async def _get_event_message_components(
+            self,
+            event: MonitoringEvent,
+            entities_fetch_cache: EntitiesFetchCache,
+    ) -> EventMessageComponents:
         """Collect event message components for notifier."""
-        trigger = await self.context.database_gateway.get_entity_by_id(Trigger, event.trigger_id)
-        host = await self.context.database_gateway.get_entity_by_id(Host, trigger.host_id)
-        host_groups = await self.context.database_gateway.get_host_groups_by_host_id(host.id)
+        trigger, host, host_groups = await entities_fetch_cache.get_trigger_origin(
+            event.trigger_id, self.context.database_gateway.get_trigger_origin
+        )
 
         return EventMessageComponents(event=event, trigger=trigger, host=host, host_groups=host_groups)
 
@@ -96,18 +145,37 @@ class Controller:
             self,
             notification_sinks: list[NotificationSink],
             event: MonitoringEvent,
+            entities_fetch_cache: EntitiesFetchCache,
     ) -> None:
         """Notify all users about raised event."""
-        event_message_components = await self._get_event_message_components(event)
-        for notification_sink in notification_sinks:
-            await self.context.notifier_controller.notify_event_raised(notification_sink, event_message_components)
+        event_message_components = await self._get_event_message_components(event, entities_fetch_cache)
+        await self._fanout(
+            self.context.notifier_controller.notify_event_raised, notification_sinks, event_message_components
+        )
 
     async def _notify_about_resolved_event(
             self,
             notification_sinks: list[NotificationSink],
             event: MonitoringEvent,
+            entities_fetch_cache: EntitiesFetchCache,
     ) -> None:
         """Notify all users about resolved event."""
-        event_message_components = await self._get_event_message_components(event)
-        for notification_sink in notification_sinks:
-            await self.context.notifier_controller.notify_event_resolved(notification_sink, event_message_components)
+        event_message_components = await self._get_event_message_components(event, entities_fetch_cache)
+        await self._fanout(
+            self.context.notifier_controller.notify_event_resolved, notification_sinks, event_message_components
+        )
+
+    @staticmethod
+    async def _fanout(
+            notify: Callable[[NotificationSink, EventMessageComponents], Awaitable[None]],
+            notification_sinks: list[NotificationSink],
+            event_message_components: EventMessageComponents,
+    ) -> None:
+        """Notify all notification sinks concurrently."""
+        results = await asyncio.gather(
+            *(notify(notification_sink, event_message_components) for notification_sink in notification_sinks),
+            return_exceptions=True,
+        )
+        for notification_sink, result in zip(notification_sinks, results):
+            if isinstance(result, Exception):
+                logger.error(f"Notification sink {notification_sink.id} notifying failed: {repr(result)}")
@@ -17,16 +17,16 @@ from outer_resources.database_gateway import DatabaseGateway
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HostGroupsDiff:
     """HostGroupsDiff."""
 
-    new_host_groups: list[HostGroup]
-    obsolete_host_groups: list[HostGroup]
-    enabled_host_groups: list[HostGroup]
+    new_host_groups: tuple[HostGroup, ...]
+    obsolete_host_groups: tuple[HostGroup, ...]
+    enabled_host_groups: tuple[HostGroup, ...]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HostSource:
     """HostSource."""
 
@@ -34,22 +34,23 @@ class HostSource:
     host: Host
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HostsDiff:
     """HostsDiff."""
 
-    new_host_sources: list[HostSource]
-    obsolete_host_sources: list[HostSource]
-    enabled_host_sources: list[HostSource]
+    new_host_sources: tuple[HostSource, ...]
+    obsolete_host_sources: tuple[HostSource, ...]
+    enabled_host_sources: tuple[HostSource, ...]
+    saved_host_ids: frozenset[int] = frozenset()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TriggersDiff:
     """TriggersDiff."""
 
-    appeared_triggers: list[Trigger]
-    obsolete_triggers: list[Trigger]
-    enabled_triggers: list[Trigger]
+    appeared_triggers: tuple[Trigger, ...]
+    obsolete_triggers: tuple[Trigger, ...]
+    enabled_triggers: tuple[Trigger, ...]
 
 
 class DatabaseActualizer(AsyncInitable):
@@ -83,21 +84,34 @@ class DatabaseActualizer(AsyncInitable):
         """Update Zabbix entities in the database."""
         while True:
             try:
-                await self._actualize_host_groups()
-                await self._actualize_hosts()
-                await self._actualize_triggers()
+                monitoring_system_controller = self.context.monitoring_system_controller
+                async with asyncio.TaskGroup() as task_group:
+                    actual_host_groups_task = task_group.create_task(monitoring_system_controller.get_host_groups())
+                    actual_host_group_id_to_hosts_task = task_group.create_task(
+                        monitoring_system_controller.get_host_group_id_to_hosts()
+                    )
+                    actual_triggers_task = task_group.create_task(monitoring_system_controller.get_triggers())
+
+                    await self._actualize_host_groups(await actual_host_groups_task)
+                    await self._actualize_hosts(await actual_host_group_id_to_hosts_task)
+                    await self._actualize_triggers(await actual_triggers_task)
             except Exception as er:
                 logger.error(f"Monitoring system structures update failed: {repr(er)}")
             await asyncio.sleep(self.config.actualization_interval_sec)
 
-    async def _actualize_host_groups(self) -> None:
+    async def _actualize_host_groups(self, actual_host_groups: list[HostGroup]) -> None:
         """Update Zabbix host groups in the database."""
-        actual_host_groups = await self.context.monitoring_system_controller.get_host_groups()
-        saved_host_groups = await self.context.database_gateway.select(HostGroup)
-
-        host_group_diff = await self._cast_host_groups_diff(
+        saved_host_group_id_to_host_group: dict[int, HostGroup] = {}
+        disabled_host_group_ids: set[int] = set()
+        async for host_group in self.context.database_gateway.iterate(HostGroup):
+            saved_host_group_id_to_host_group[host_group.id] = host_group
+            if host_group.disabled_at:
+                disabled_host_group_ids.add(host_group.id)
+
+        host_group_diff = self._cast_host_groups_diff(
             actual_host_groups=actual_host_groups,
-            saved_host_groups=saved_host_groups,
+            saved_host_group_id_to_host_group=saved_host_group_id_to_host_group,
+            disabled_host_group_ids=disabled_host_group_ids,
         )
         await self.context.database_gateway.insert(host_group_diff.new_host_groups)
         await self.context.database_gateway.enable_host_groups(
@@ -114,106 +128,101 @@ class DatabaseActualizer(AsyncInitable):
         )
 
     @staticmethod
-    async def _cast_host_groups_diff(
+    def _cast_host_groups_diff(
             *,
             actual_host_groups: list[HostGroup],
-            saved_host_groups: list[HostGroup],
+            saved_host_group_id_to_host_group: dict[int, HostGroup],
+            disabled_host_group_ids: set[int],
     ) -> HostGroupsDiff:
         """Collect group hosts difference with Zabbix and DB."""
         actual_host_group_id_to_host_group = {host_group.id: host_group for host_group in actual_host_groups}
-        actual_host_group_ids = set(actual_host_group_id_to_host_group)
-
-        saved_host_group_id_to_host_group = {host_group.id: host_group for host_group in saved_host_groups}
-        saved_host_group_ids = set(saved_host_group_id_to_host_group)
 
-        disabled_host_group_id_to_host_group = {
-            host_group.id: host_group for host_group in saved_host_groups if host_group.disabled_at
-        }
-        disabled_host_group_ids = set(disabled_host_group_id_to_host_group)
+        actual_host_group_ids = actual_host_group_id_to_host_group.keys()
+        saved_host_group_ids = saved_host_group_id_to_host_group.keys()
 
         appeared_host_group_external_ids = actual_host_group_ids - saved_host_group_ids
         enabled_host_group_external_ids = disabled_host_group_ids & actual_host_group_ids
         obsolete_host_group_external_ids = saved_host_group_ids - disabled_host_group_ids - actual_host_group_ids
 
         return HostGroupsDiff(
-            new_host_groups=[actual_host_group_id_to_host_group[host_group_external_id]
-                             for host_group_external_id in appeared_host_group_external_ids],
-            enabled_host_groups=[saved_host_group_id_to_host_group[host_group_external_id]
-                                 for host_group_external_id in enabled_host_group_external_ids],
-            obsolete_host_groups=[saved_host_group_id_to_host_group[host_group_external_id]
-                                  for host_group_external_id in obsolete_host_group_external_ids],
+            new_host_groups=tuple(actual_host_group_id_to_host_group[host_group_external_id]
+                                  for host_group_external_id in appeared_host_group_external_ids),
+            enabled_host_groups=tuple(saved_host_group_id_to_host_group[host_group_external_id]
+                                      for host_group_external_id in enabled_host_group_external_ids),
+            obsolete_host_groups=tuple(saved_host_group_id_to_host_group[host_group_external_id]
+                                       for host_group_external_id in obsolete_host_group_external_ids),
         )
 
-    async def _actualize_hosts(self) -> None:
+    async def _actualize_hosts(self, actual_host_group_id_to_hosts: dict[int, list[Host]]) -> None:
         """Update Zabbix hosts in the database."""
-        actual_host_group_id_to_hosts = await self.context.monitoring_system_controller.get_host_group_id_to_hosts()
-
-        saved_host_group_id_to_hosts = await self._get_host_group_id_to_hosts()
+        saved_host_group_id_to_hosts = await self.context.database_gateway.get_host_group_id_to_hosts()
 
-        hosts_diff = await self._cast_hosts_diff(
+        hosts_diff = self._cast_hosts_diff(
             actual_host_group_id_to_hosts=actual_host_group_id_to_hosts,
             saved_host_group_id_to_hosts=saved_host_group_id_to_hosts,
         )
 
-        await self._insert_host_sources(hosts_diff.new_host_sources)
+        await self._insert_host_sources(hosts_diff.new_host_sources, hosts_diff.saved_host_ids)
 
         logger.info(f"Inserted {len(hosts_diff.new_host_sources)} new host sources. "
                     f"Enabled {len([])} host sources. "
                     f"Disabled {len([])} obsolete host sources")
 
     @staticmethod
-    async def _cast_hosts_diff(
+    def _cast_hosts_diff(
         *,
         actual_host_group_id_to_hosts: dict[int, list[Host]],
         saved_host_group_id_to_hosts: dict[int, list[Host]],
     ) -> HostsDiff:
         """Collect hosts difference with Zabbix and DB."""
-        actual_host_group_id_to_host_ids: dict[int, set[int]] = {}
-        actual_host_id_to_host = {}
-        for group_id, hosts in actual_host_group_id_to_hosts.items():
-            for host in hosts:
-                actual_host_group_id_to_host_ids.setdefault(group_id, set()).add(host.id)
-                actual_host_id_to_host[host.id] = host
-
-        saved_host_group_id_to_host_ids: dict[int, set[int]] = {}
-        saved_host_id_to_host = {}
-        for group_id, hosts in saved_host_group_id_to_hosts.items():
-            for host in hosts:
-                saved_host_group_id_to_host_ids.setdefault(group_id, set()).add(host.id)
-                saved_host_id_to_host[host.id] = host
-
-        new_host_sources = []
-        for group_id, actual_host_ids in actual_host_group_id_to_host_ids.items():
-            saved_host_ids = saved_host_group_id_to_host_ids.get(group_id)
-            new_host_ids = actual_host_ids - saved_host_ids if saved_host_ids is not None else actual_host_ids
-            for host_id in new_host_ids:
-                new_host_sources.append(HostSource(host_group_id=group_id, host=actual_host_id_to_host[host_id]))
+        saved_host_group_id_to_host_ids = {
+            group_id: {host.id for host in hosts} for group_id, hosts in saved_host_group_id_to_hosts.items()
+        }
 
         return HostsDiff(
-            new_host_sources=new_host_sources,
-            enabled_host_sources=[],
-            obsolete_host_sources=[],
+            new_host_sources=tuple(
+                HostSource(host_group_id=group_id, host=host)
+                for group_id, hosts in actual_host_group_id_to_hosts.items()
+                for host_id, host in {group_host.id: group_host for group_host in hosts}.items()
+                if host_id not in saved_host_group_id_to_host_ids.get(group_id, ())
+            ),
+            enabled_host_sources=(),
+            obsolete_host_sources=(),
+            saved_host_ids=frozenset().union(*saved_host_group_id_to_host_ids.values()),
         )
 
-    async def _insert_host_sources(self, host_sources: list[HostSource]) -> None:
-        """Insert new hosts to DB."""
+    async def _insert_host_sources(self, host_sources: tuple[HostSource, ...], saved_host_ids: frozenset[int]) -> None:
+        """Insert new hosts and their host group links to DB."""
         if not host_sources:
             return
 
-        for host_source in host_sources:
-            await self.context.database_gateway.insert(host_source.host)
+        host_id_to_host = {
+            host_source.host.id: host_source.host
+            for host_source in host_sources
+            if host_source.host.id not in saved_host_ids
+        }
+        async with self.context.database_gateway.ensure_session():
+            await self.context.database_gateway.insert(list(host_id_to_host.values()))
             await self.context.database_gateway.insert(
-                HostToHostGroup(host_id=host_source.host.id, host_group_id=host_source.host_group_id)
+                [
+                    HostToHostGroup(host_id=host_source.host.id, host_group_id=host_source.host_group_id)
+                    for host_source in host_sources
+                ]
             )
 
-    async def _actualize_triggers(self) -> None:
+    async def _actualize_triggers(self, actual_triggers: list[Trigger]) -> None:
         """Update Zabbix triggers in the database."""
-        actual_triggers = await self.context.monitoring_system_controller.get_triggers()
-        saved_triggers = await self.context.database_gateway.select(Trigger)
-
-        triggers_diff = await self._cast_triggers_diff(
+        saved_trigger_id_to_trigger: dict[int, Trigger] = {}
+        saved_disabled_trigger_ids: set[int] = set()
+        async for trigger in self.context.database_gateway.iterate(Trigger):
+            saved_trigger_id_to_trigger[trigger.id] = trigger
+            if trigger.disabled_at:
+                saved_disabled_trigger_ids.add(trigger.id)
+
+        triggers_diff = self._cast_triggers_diff(
             actual_triggers=actual_triggers,
-            saved_triggers=saved_triggers,
+            saved_trigger_id_to_trigger=saved_trigger_id_to_trigger,
+            saved_disabled_trigger_ids=saved_disabled_trigger_ids,
         )
 
         await self.context.database_gateway.insert(triggers_diff.appeared_triggers)
@@ -223,35 +232,24 @@ class DatabaseActualizer(AsyncInitable):
                     f"Disabled {len(triggers_diff.obsolete_triggers)} obsolete triggers")
 
     @staticmethod
-    async def _cast_triggers_diff(*, actual_triggers: list[Trigger], saved_triggers: list[Trigger]) -> TriggersDiff:
+    def _cast_triggers_diff(
+            *,
+            actual_triggers: list[Trigger],
+            saved_trigger_id_to_trigger: dict[int, Trigger],
+            saved_disabled_trigger_ids: set[int],
+    ) -> TriggersDiff:
         """Collect triggers difference with Zabbix and DB."""
         actual_trigger_id_to_trigger = {trigger.id: trigger for trigger in actual_triggers}
-        actual_trigger_ids = set(actual_trigger_id_to_trigger)
-        saved_trigger_id_to_trigger = {trigger.id: trigger for trigger in saved_triggers}
-        saved_trigger_ids = set(saved_trigger_id_to_trigger)
 
-        saved_disabled_trigger_id_to_trigger = {
-            trigger.id: trigger for trigger in saved_triggers if trigger.disabled_at
-        }
-        saved_disabled_trigger_ids = set(saved_disabled_trigger_id_to_trigger)
+        actual_trigger_ids = actual_trigger_id_to_trigger.keys()
+        saved_trigger_ids = saved_trigger_id_to_trigger.keys()
 
         new_trigger_ids = actual_trigger_ids - saved_trigger_ids
         obsolete_trigger_ids = saved_trigger_ids - saved_disabled_trigger_ids - actual_trigger_ids
         enabled_trigger_ids = saved_disabled_trigger_ids & actual_trigger_ids
 
         return TriggersDiff(
-            appeared_triggers=[actual_trigger_id_to_trigger[trigger_id] for trigger_id in new_trigger_ids],
-            enabled_triggers=[saved_trigger_id_to_trigger[trigger_id] for trigger_id in enabled_trigger_ids],
-            obsolete_triggers=[saved_trigger_id_to_trigger[trigger_id] for trigger_id in obsolete_trigger_ids],
+            appeared_triggers=tuple(actual_trigger_id_to_trigger[trigger_id] for trigger_id in new_trigger_ids),
+            enabled_triggers=tuple(saved_trigger_id_to_trigger[trigger_id] for trigger_id in enabled_trigger_ids),
+            obsolete_triggers=tuple(saved_trigger_id_to_trigger[trigger_id] for trigger_id in obsolete_trigger_ids),
         )
-
-    async def _get_host_group_id_to_hosts(self) -> dict[int, list[Host]]:
-        """Get host groups and hosts from DB."""
-        host_group_id_to_hosts: dict[int, list[Host]] = {}
-        async with self.context.database_gateway.ensure_session():
-            host_groups = await self.context.database_gateway.select(HostGroup)
-            for host_group in host_groups:
-                hosts = await self.context.database_gateway.get_hosts_by_host_group_id(host_group.id)
-                host_group_id_to_hosts[host_group.id] = hosts
-
-        return host_group_id_to_hosts
@@ -1,9 +1,9 @@
 """Initer module."""
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import init_helpers
-from aiohttp import ClientSession
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
 from async_tools import AsyncInitable, AsyncDeinitable
 from init_helpers import init_logs
 from sqlalchemy_tools.database_connector.database_connector import DatabaseConnector
@@ -25,6 +25,17 @@ from outer_resources.zabbix_connector import ZabbixConnector
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class ClientSessionConfig:
+    """Http client session config."""
+
+    limit: int = 200
+    limit_per_host: int = 50
+    ttl_dns_cache_sec: int = 300
+    keepalive_timeout_sec: float = 60
+    total_timeout_sec: float = 180
+
+
 @dataclass
 class Initer:
     """Init all project components."""
@@ -39,6 +50,8 @@ class Initer:
         zabbix_connector: ZabbixConnector.Config
         database_actualizer: DatabaseActualizer.Config
         telegram_bot: TelegramBot.Config = None
+        telegram_dispatcher: TelegramDispatcher.Config = field(default_factory=TelegramDispatcher.Config)
+        client_session: ClientSessionConfig = field(default_factory=ClientSessionConfig)
 
     config: Config
 
@@ -79,9 +92,11 @@ class Initer:
 
     async def __aenter__(self) -> Controller:
         """aenter."""
+        self._init_client_session()
         self._init_database_components()
         self._init_zabbix_components()
-        self._init_telegram_components()
+        if self.config.telegram_bot is not None:
+            self._init_telegram_components()
 
         self.context.controller = Controller(self.context)
 
@@ -90,6 +105,20 @@ class Initer:
         await self.context.async_init()
         return self.context.controller
 
+    def _init_client_session(self) -> None:
+        """Init http client session shared by all http connectors."""
+        config = self.config.client_session
+        self.context.session = ClientSession(
+            connector=TCPConnector(
+                limit=config.limit,
+                limit_per_host=config.limit_per_host,
+                ttl_dns_cache=config.ttl_dns_cache_sec,
+                keepalive_timeout=config.keepalive_timeout_sec,
+                enable_cleanup_closed=True,
+            ),
+            timeout=ClientTimeout(total=config.total_timeout_sec),
+        )
+
     def _init_database_components(self) -> None:
         """Init all working with database classes."""
         self.context.database_connector = DatabaseConnector(self.config.database_connector)
@@ -105,7 +134,7 @@ class Initer:
     def _init_telegram_components(self) -> None:
         """Init all working with telegram classes."""
         self.context.telegram_bot = TelegramBot(self.config.telegram_bot)
-        self.context.telegram_dispatcher = TelegramDispatcher(self.context)
+        self.context.telegram_dispatcher = TelegramDispatcher(self.config.telegram_dispatcher, self.context)
         self.context.telegram_controller = TelegramController(self.context)
         self.context.telegram_renderer = TelegramRenderer()
         self.context.telegram_keyboard_creator = TelegramKeyboardCreator(self.context)
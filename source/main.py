@@ -4,6 +4,11 @@ import logging
 from typing import NoReturn
 from initer import Initer
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +22,8 @@ async def main() -> NoReturn:
         while True:
             await asyncio.sleep(1)
 
-try:
-    asyncio.run(main())
-except KeyboardInterrupt as e:
-    logger.warning(f"Shutting down: {repr(e)}")
+if __name__ == "__main__":
+    try:
+        (uvloop.run if uvloop is not None else asyncio.run)(main())
+    except KeyboardInterrupt as e:
+        logger.warning(f"Shutting down: {repr(e)}")
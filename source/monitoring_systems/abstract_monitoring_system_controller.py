@@ -7,7 +7,7 @@ from entities.monitoring_system_structure.host_group import HostGroup
 from entities.monitoring_system_structure.trigger import Trigger
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MonitoringEvent:
     """MonitoringEvent."""
 
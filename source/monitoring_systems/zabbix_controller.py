@@ -1,8 +1,8 @@
 """ZabbixController module."""
+from collections import defaultdict
 from dataclasses import dataclass
 import asyncio
 import logging
-from enum import StrEnum, unique
 
 from async_tools import AsyncInitable
 
@@ -16,15 +16,6 @@ from utils.timestamp_converters import get_current_time_sec
 
 logger = logging.getLogger(__name__)
 
-
-@unique
-class TriggerStatus(StrEnum):
-    """TriggerStatus."""
-
-    RAISED = "raised"
-    RESOLVED = "resolved"
-
-
 class ZabbixController(AbstractMonitoringSystemController, AsyncInitable):
     """Main Zabbix logic."""
 
@@ -33,6 +24,7 @@ class ZabbixController(AbstractMonitoringSystemController, AsyncInitable):
         """config."""
 
         collection_interval_sec: int
+        max_backoff_sec: int = 300
 
     @dataclass
     class Context:
@@ -46,31 +38,34 @@ class ZabbixController(AbstractMonitoringSystemController, AsyncInitable):
         AsyncInitable.__init__(self)
         self.config = config
         self.context = context
+        self._events_handling_task: asyncio.Task | None = None
+        self._pending_events: list[MonitoringEvent] = []
         logger.info(f"{type(self).__name__} inited")
 
     async def get_host_groups(self) -> list[HostGroup]:
         """Get actual Zabbix host groups."""
         zabbix_host_groups = await self.context.zabbix_connector.get_host_groups()
-        return [HostGroup(id=int(group.groupid), title=group.name) for group in zabbix_host_groups]
+        return [HostGroup(id=group.groupid, title=group.name) for group in zabbix_host_groups]
 
     async def get_host_group_id_to_hosts(self) -> dict[int, list[Host]]:
         """Get actual Zabbix host groups and hosts."""
         zabbix_hosts = await self.context.zabbix_connector.get_hosts()
-        host_group_id_to_hosts = {}
-        for host in zabbix_hosts:
-            for group_id in host.group_ids:
-                host_group_id_to_hosts.setdefault(int(group_id), []).append(Host(id=int(host.hostid), title=host.name))
-        return host_group_id_to_hosts
+        host_group_id_to_hosts: dict[int, list[Host]] = defaultdict(list)
+        for zabbix_host in zabbix_hosts:
+            host = Host(id=zabbix_host.hostid, title=zabbix_host.name)
+            for group_id in zabbix_host.group_ids:
+                host_group_id_to_hosts[group_id].append(host)
+        return dict(host_group_id_to_hosts)
 
     async def get_triggers(self) -> list[Trigger]:
         """Get actual Zabbix triggers."""
         zabbix_triggers = await self.context.zabbix_connector.get_triggers()
         return [
             Trigger(
-                id=int(trigger.triggerid),
+                id=trigger.triggerid,
                 title=trigger.description,
-                severity=int(trigger.priority),
-                host_id=int(trigger.host_id)
+                severity=trigger.priority,
+                host_id=trigger.host_id
             )
             for trigger in zabbix_triggers
         ]
@@ -78,15 +73,16 @@ class ZabbixController(AbstractMonitoringSystemController, AsyncInitable):
     async def get_unresolved_events(self) -> list[MonitoringEvent]:
         """Get actual monitoring system unresolved events."""
         current_cycle_problems = await self.context.zabbix_connector.get_problems()
+        current_time_sec = get_current_time_sec()
         events = []
-        for problem in current_cycle_problems:
+        for problem in current_cycle_problems.values():
             events.append(
                 MonitoringEvent(
                     external_id=problem.external_id,
-                    trigger_id=int(problem.trigger_external_id),
+                    trigger_id=problem.trigger_external_id,
                     opdata=problem.opdata,
-                    occurred_at=int(problem.occurred_at),
-                    resolved_at=get_current_time_sec()
+                    occurred_at=problem.occurred_at,
+                    resolved_at=current_time_sec
                 )
             )
         return events
@@ -98,70 +94,113 @@ class ZabbixController(AbstractMonitoringSystemController, AsyncInitable):
     async def _collect_monitoring_events(self) -> None:
         """Periodic collect actual raised and resolved monitoring events."""
         logger.debug("Collecting monitoring events started")
-        events: list[MonitoringEvent] = []
-        current_cycle_problems = await self.context.zabbix_connector.get_problems()
-        previous_cycle_problems = current_cycle_problems
+        previous_cycle_problems: dict[str, ZabbixProblem] = {}
+        first_cycle = True
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        consecutive_failures = 0
+        get_problems = self.context.zabbix_connector.get_problems
+        collection_interval_sec = self.config.collection_interval_sec
 
         while True:
             try:
-                events.clear()
-                current_cycle_problems = await self.context.zabbix_connector.get_problems()
+                current_cycle_problems = await get_problems()
+            except Exception as e:
+                consecutive_failures += 1
+                backoff_sec = max(
+                    collection_interval_sec,
+                    min(collection_interval_sec * 2 ** consecutive_failures, self.config.max_backoff_sec),
+                )
+                logger.error(
+                    f"Zabbix problems fetching failed {consecutive_failures} times in a row, "
+                    f"retrying in {backoff_sec} sec: {repr(e)}"
+                )
+                await asyncio.sleep(backoff_sec)
+                next_tick = loop.time()
+                continue
+            consecutive_failures = 0
 
-                raised_problems = self._construct_raised_problems(current_cycle_problems, previous_cycle_problems)
-                if raised_problems:
+            try:
+                if first_cycle:
+                    previous_cycle_problems = current_cycle_problems
+                    first_cycle = False
+
+                raised_problems, resolved_problems = self._diff_problems(
+                    current_cycle_problems, previous_cycle_problems
+                )
+                if raised_problems and logger.isEnabledFor(logging.DEBUG):
                     logger.debug(f"Raised problems: {raised_problems}")
-                for problem in raised_problems:
-                    events.append(
-                        MonitoringEvent(
-                            external_id=problem.external_id,
-                            trigger_id=int(problem.trigger_external_id),
-                            opdata=problem.opdata,
-                            occurred_at=int(problem.occurred_at),
-                        )
+                raised_events = [
+                    MonitoringEvent(
+                        external_id=problem.external_id,
+                        trigger_id=problem.trigger_external_id,
+                        opdata=problem.opdata,
+                        occurred_at=problem.occurred_at,
                     )
+                    for problem in raised_problems
+                ]
 
-                resolved_problems = self._construct_resolved_problems(current_cycle_problems, previous_cycle_problems)
-                if resolved_problems:
+                if resolved_problems and logger.isEnabledFor(logging.DEBUG):
                     logger.debug(f"Resolved problems: {resolved_problems}")
-                for problem in resolved_problems:
-                    events.append(
-                        MonitoringEvent(
-                            external_id=problem.external_id,
-                            trigger_id=int(problem.trigger_external_id),
-                            opdata=problem.opdata,
-                            occurred_at=int(problem.occurred_at),
-                            resolved_at=get_current_time_sec()
-                        )
+                resolved_at = get_current_time_sec()
+                resolved_events = [
+                    MonitoringEvent(
+                        external_id=problem.external_id,
+                        trigger_id=problem.trigger_external_id,
+                        opdata=problem.opdata,
+                        occurred_at=problem.occurred_at,
+                        resolved_at=resolved_at
                     )
+                    for problem in resolved_problems
+                ]
 
-                await self.context.controller.handle_monitoring_events(events)
+                self._dispatch_monitoring_events(raised_events + resolved_events)
                 previous_cycle_problems = current_cycle_problems
 
             except Exception as e:
                 logger.error(f"Error while collecting new monitoring events: {repr(e)}")
 
-            await asyncio.sleep(self.config.collection_interval_sec)
+            next_tick += collection_interval_sec
+            if (delay := next_tick - loop.time()) < 0:
+                logger.warning(f"Collecting monitoring events is {-delay:.1f} sec behind schedule")
+                next_tick = loop.time()
+            await asyncio.sleep(max(0.0, delay))
+
+    def _dispatch_monitoring_events(self, events: list[MonitoringEvent]) -> None:
+        """Start events handling or buffer events until the running handling finishes."""
+        if self._events_handling_task is not None:
+            self._pending_events.extend(events)
+            if events:
+                logger.warning(
+                    f"Monitoring events handling is still running, {len(self._pending_events)} events are buffered"
+                )
+            return
 
-    @staticmethod
-    def _construct_raised_problems(
-        current_cycle_problems: set[ZabbixProblem],
-        previous_cycle_problems: set[ZabbixProblem],
-    ) -> set[ZabbixProblem]:
-        """Construct raised Zabbix problems at current moment."""
-        previous_problem_external_ids = {problem.external_id for problem in previous_cycle_problems}
-        current_problem_external_ids = {problem.external_id for problem in current_cycle_problems}
-        raised_problem_external_ids = current_problem_external_ids - previous_problem_external_ids
+        if not events:
+            return
+
+        self._events_handling_task = asyncio.create_task(self.context.controller.handle_monitoring_events(events))
+        self._events_handling_task.add_done_callback(self._on_events_handled)
+
+    def _on_events_handled(self, task: asyncio.Task) -> None:
+        """Release finished monitoring events handling task and dispatch buffered events."""
+        self._events_handling_task = None
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Error while handling monitoring events: {repr(task.exception())}")
 
-        return {problem for problem in current_cycle_problems if problem.external_id in raised_problem_external_ids}
+        pending_events, self._pending_events = self._pending_events, []
+        self._dispatch_monitoring_events(pending_events)
 
     @staticmethod
-    def _construct_resolved_problems(
-        current_cycle_problems: set[ZabbixProblem],
-        previous_cycle_problems: set[ZabbixProblem],
-    ) -> set[ZabbixProblem]:
-        """Construct resolved Zabbix problems at current moment."""
-        previous_problem_external_ids = {problem.external_id for problem in previous_cycle_problems}
-        current_problem_external_ids = {problem.external_id for problem in current_cycle_problems}
-        resolved_problem_external_ids = previous_problem_external_ids - current_problem_external_ids
-
-        return {problem for problem in previous_cycle_problems if problem.external_id in resolved_problem_external_ids}
+    def _diff_problems(
+        current_cycle_problems: dict[str, ZabbixProblem],
+        previous_cycle_problems: dict[str, ZabbixProblem],
+    ) -> tuple[list[ZabbixProblem], list[ZabbixProblem]]:
+        """Construct raised and resolved Zabbix problems at current moment."""
+        raised_problem_external_ids = current_cycle_problems.keys() - previous_cycle_problems.keys()
+        resolved_problem_external_ids = previous_cycle_problems.keys() - current_cycle_problems.keys()
+
+        return (
+            [current_cycle_problems[external_id] for external_id in raised_problem_external_ids],
+            [previous_cycle_problems[external_id] for external_id in resolved_problem_external_ids],
+        )
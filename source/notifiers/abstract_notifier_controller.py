@@ -10,7 +10,7 @@ from entities.notification_sink import NotificationSink
 from monitoring_systems.abstract_monitoring_system_controller import MonitoringEvent
 
 
-@dataclass
+@dataclass(slots=True)
 class EventMessageComponents:
     """EventMessageComponents."""
 
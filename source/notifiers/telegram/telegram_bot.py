@@ -1,9 +1,13 @@
 """TelegramBot module."""
+import asyncio
 import logging
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Optional
 
 from aiogram import Bot
+from aiogram.types import Message
+from aiogram.utils.exceptions import MessageNotModified, RetryAfter
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +22,10 @@ class TelegramBot(Bot):
         token: str
         proxy: Optional[str] = None
         connections_limit: Optional[int] = None
+        messages_per_second: float = 25
+        chat_message_interval_sec: float = 1
+        flood_retries: int = 3
+        edited_messages_cache_size: int = 10000
 
     def __init__(self, config: Config):
         """init."""
@@ -26,8 +34,75 @@ class TelegramBot(Bot):
             connections_limit=config.connections_limit,
             proxy=config.proxy,
         )
+        self.config = config
+        self._next_send_time = 0.0
+        self._chat_id_to_next_send_time: OrderedDict[str, float] = OrderedDict()
+        self._edited_message_to_content_hash: OrderedDict[tuple[str, int], int] = OrderedDict()
         logger.info(f"{type(self).__name__} inited")
 
+    async def send_message(self, chat_id: int | str, text: str, *args, **kwargs) -> Message:
+        """Send message keeping within Telegram flood limits."""
+        retries_left = self.config.flood_retries
+        while True:
+            await asyncio.sleep(self._reserve_send_delay(str(chat_id)))
+            try:
+                return await super().send_message(chat_id, text, *args, **kwargs)
+            except RetryAfter as e:
+                if retries_left <= 0:
+                    raise
+                retries_left -= 1
+                logger.warning(f"Flood limit exceeded in chat {chat_id}, retrying in {e.timeout} sec")
+                await asyncio.sleep(e.timeout)
+
+    async def edit_message_text(
+            self,
+            text: str,
+            chat_id: int | str | None = None,
+            message_id: int | None = None,
+            **kwargs,
+    ) -> Message | bool:
+        """Edit message text skipping edits that would not change the message."""
+        if chat_id is None or message_id is None:
+            return await super().edit_message_text(text, chat_id, message_id, **kwargs)
+
+        edited_message = (str(chat_id), message_id)
+        content_hash = hash((text, *(f"{key}={value}" for key, value in sorted(kwargs.items()))))
+        if self._edited_message_to_content_hash.get(edited_message) == content_hash:
+            self._edited_message_to_content_hash.move_to_end(edited_message)
+            return True
+
+        try:
+            result = await super().edit_message_text(text, chat_id, message_id, **kwargs)
+        except MessageNotModified:
+            result = True
+        self._edited_message_to_content_hash[edited_message] = content_hash
+        self._edited_message_to_content_hash.move_to_end(edited_message)
+        if len(self._edited_message_to_content_hash) > self.config.edited_messages_cache_size:
+            self._edited_message_to_content_hash.popitem(last=False)
+        return result
+
+    async def edit_message_reply_markup(
+            self,
+            chat_id: int | str | None = None,
+            message_id: int | None = None,
+            **kwargs,
+    ) -> Message | bool:
+        """Edit message reply markup forgetting previously edited message content."""
+        self._edited_message_to_content_hash.pop((str(chat_id), message_id), None)
+        return await super().edit_message_reply_markup(chat_id, message_id, **kwargs)
+
+    def _reserve_send_delay(self, chat_id: str) -> float:
+        """Reserve nearest send slot allowed by global and per chat limits and return delay until it."""
+        now = asyncio.get_running_loop().time()
+        send_time = max(now, self._next_send_time, self._chat_id_to_next_send_time.get(chat_id, 0.0))
+        self._next_send_time = send_time + 1 / self.config.messages_per_second
+        self._chat_id_to_next_send_time[chat_id] = send_time + self.config.chat_message_interval_sec
+        self._chat_id_to_next_send_time.move_to_end(chat_id)
+        # Slots are reserved in increasing time order, so chats with elapsed intervals are at the front
+        while self._chat_id_to_next_send_time and next(iter(self._chat_id_to_next_send_time.values())) <= now:
+            self._chat_id_to_next_send_time.popitem(last=False)
+        return send_time - now
+
     async def check_is_bot_administrator(self, chat_id: int) -> bool:
         """Check is bot administrator in current chat."""
         if chat_id > 0:
@@ -1,5 +1,6 @@
 """TelegramController module."""
 import asyncio
+import functools
 import logging
 from dataclasses import dataclass
 from enum import StrEnum
@@ -16,6 +17,7 @@ from entities.monitoring_system_structure.host_group import HostGroup
 from entities.monitoring_system_structure.trigger import Trigger
 from entities.notification_sink import NotificationSink
 from entities.notification_sink_to_trigger import NotificationSinkToTrigger
+from entities.time_zone import TimeZone
 from notifiers.abstract_notifier_controller import AbstractNotifierController, EventMessageComponents
 from notifiers.telegram.telegram_bot import TelegramBot
 from notifiers.telegram.telegram_dispatcher import TelegramDispatcher
@@ -23,7 +25,7 @@ from notifiers.telegram.telegram_keyboard_creator import TelegramButtonAction, c
     TelegramKeyboardCreator
 from notifiers.telegram.telegram_renderer import TelegramRenderer
 from outer_resources.database_gateway import DatabaseGateway
-from utils.special_symbols import SpecialSymbol
+from utils.timing import timed
 from utils.translation import _, LanguageCode, LANGUAGE_CODE_TO_TITLE
 
 logger = logging.getLogger(__name__)
@@ -48,6 +50,38 @@ TELEGRAM_COMMAND_TO_DESCRIPTION: dict[TelegramCommand, str] = {
     TelegramCommand.LANGUAGE_SETTING: "language setting"
 }
 
+DEFAULT_BOT_COMMANDS: list[BotCommand] = [
+    BotCommand(command=command, description=description)
+    for command, description in TELEGRAM_COMMAND_TO_DESCRIPTION.items()
+]
+
+
+@functools.lru_cache(maxsize=len(LanguageCode))
+def render_help_message_text(language_code: LanguageCode) -> str:
+    """Render /help message text once per language."""
+    return text(
+        _(
+            "Emoji to problem severity:\n"
+            "ℹ - info\n"
+            "😐 - warning\n"
+            "🔥 - average\n"
+            "👹 - high\n"
+            "💀 - disaster\n"
+            "✅ - problem resolved.\n\n"
+            "Commands:\n"
+            "/{} - detailed dashboard analogue\n"
+            "/{} - subscription settings\n"
+            "/{} - time zone setting\n"
+            "/{} - language setting\n",
+            language_code
+        ).format(
+            TelegramCommand.GET_CURRENT_PROBLEMS,
+            TelegramCommand.SUBSCRIPTION_SETTINGS,
+            TelegramCommand.TIME_ZONE_SETTING,
+            TelegramCommand.LANGUAGE_SETTING
+        )
+    )
+
 
 class TelegramController(AbstractNotifierController, AsyncInitable):
     """Class with main telegram bot logic (commands and buttons)."""
@@ -64,29 +98,33 @@ class TelegramController(AbstractNotifierController, AsyncInitable):
         telegram_keyboard_creator: TelegramKeyboardCreator
 
     MAX_MESSAGE_LENGTH = 4096
+    ADMIN_PROMOTION_TIMEOUT_SEC = 600
+    ADMIN_PROMOTION_MAX_CHECK_DELAY_SEC = 30
+    _BUTTON_ACTION_TO_HANDLER_NAME: dict[str, str] = {
+        TelegramButtonAction.SUBSCRIBE_TRIGGER: "_subscribe_to_trigger",
+        TelegramButtonAction.PRE_SUBSCRIBE_MONITORING_SYSTEM: "_pre_subscribe_to_monitoring_system",
+        TelegramButtonAction.SUBSCRIBE_MONITORING_SYSTEM: "_subscribe_to_monitoring_system",
+        TelegramButtonAction.PRE_UNSUBSCRIBE_MONITORING_SYSTEM: "_pre_unsubscribe_to_monitoring_system",
+        TelegramButtonAction.UNSUBSCRIBE_MONITORING_SYSTEM: "_unsubscribe_from_monitoring_system",
+        TelegramButtonAction.UNSUBSCRIBE_TRIGGER: "_unsubscribe_from_trigger",
+        TelegramButtonAction.GO_TO_MONITORING_SYSTEMS: "_process_settings",
+        TelegramButtonAction.GO_TO_HOST_GROUPS: "_process_host_group_choosing",
+        TelegramButtonAction.GO_TO_HOSTS: "_process_host_choosing",
+        TelegramButtonAction.GO_TO_TRIGGERS: "_process_trigger_choosing",
+        TelegramButtonAction.GO_TO_TIME_ZONES: "_process_time_zone_choosing",
+        TelegramButtonAction.SET_TIME_ZONE: "_set_time_zone",
+        TelegramButtonAction.SET_LANGUAGE: "_set_language",
+        TelegramButtonAction.FINISH_SETTING: "_finish_settings",
+        TelegramButtonAction.NO_ACTION: "_no_action_button_handler",
+    }
 
     def __init__(self, context: Context) -> None:
         """init."""
         AsyncInitable.__init__(self)
         self.title = "Telegram"
         self.context = context
-        self._button_action_to_handler: dict[TelegramButtonAction, Callable[[CallbackQuery], Awaitable[None]]] = {
-            TelegramButtonAction.SUBSCRIBE_TRIGGER: self._subscribe_to_trigger,
-            TelegramButtonAction.PRE_SUBSCRIBE_MONITORING_SYSTEM: self._pre_subscribe_to_monitoring_system,
-            TelegramButtonAction.SUBSCRIBE_MONITORING_SYSTEM: self._subscribe_to_monitoring_system,
-            TelegramButtonAction.PRE_UNSUBSCRIBE_MONITORING_SYSTEM: self._pre_unsubscribe_to_monitoring_system,
-            TelegramButtonAction.UNSUBSCRIBE_MONITORING_SYSTEM: self._unsubscribe_from_monitoring_system,
-            TelegramButtonAction.UNSUBSCRIBE_TRIGGER: self._unsubscribe_from_trigger,
-            TelegramButtonAction.GO_TO_MONITORING_SYSTEMS: self._process_settings,
-            TelegramButtonAction.GO_TO_HOST_GROUPS: self._process_host_group_choosing,
-            TelegramButtonAction.GO_TO_HOSTS: self._process_host_choosing,
-            TelegramButtonAction.GO_TO_TRIGGERS: self._process_trigger_choosing,
-            TelegramButtonAction.GO_TO_TIME_ZONES: self._process_time_zone_choosing,
-            TelegramButtonAction.SET_TIME_ZONE: self._set_time_zone,
-            TelegramButtonAction.SET_LANGUAGE: self._set_language,
-            TelegramButtonAction.FINISH_SETTING: self._finish_settings,
-            TelegramButtonAction.NO_ACTION: self._no_action_button_handler,
-        }
+        self._bot_id: int | None = None
+        self._button_presses_in_progress: set[tuple[int, int, str]] = set()
         self.context.telegram_dispatcher.register_callback_query_handler(self._handle_button_press)
         self.context.telegram_dispatcher.register_message_handler(
             self._handle_start_command, commands=[TelegramCommand.START]
@@ -112,8 +150,9 @@ class TelegramController(AbstractNotifierController, AsyncInitable):
         logger.info(f"{type(self).__name__} inited")
 
     async def _async_init(self) -> None:
-        """Set default bot commands in chat on application start."""
+        """Set default bot commands in chat and remember bot id on application start."""
         await self._set_default_commands()
+        self._bot_id = (await self.context.telegram_bot.get_me()).id
 
     async def notify_event_raised(
             self,
@@ -122,7 +161,7 @@ class TelegramController(AbstractNotifierController, AsyncInitable):
     ) -> None:
         """Cast and send end message about raised event."""
         time_zone = await self.context.database_gateway.get_notification_sink_time_zone(notification_sink.id)
-        message_text = await self.context.telegram_renderer.render_event_message_text(
+        message_text = self.context.telegram_renderer.render_event_message_text(
             event_message_components, time_zone.code, notification_sink.language_code,
         )
         try:
@@ -151,35 +190,39 @@ class TelegramController(AbstractNotifierController, AsyncInitable):
 
     # Telegram commands
 
+    @timed
     async def _handle_start_command(self, message: Message) -> None:
         """/start command handler."""
-        notification_sink = await self.context.database_gateway.get_notification_sink(str(message.chat.id))
+        recipient_id = str(message.chat.id)
+        notification_sink = await self.context.database_gateway.get_notification_sink(recipient_id)
         if notification_sink is not None:
             await message.answer(_("I'm already working in this chat", notification_sink.language_code))
             return
 
+        is_group_chat = self._check_is_group_chat(message.chat.id)
         message = await self.context.telegram_bot.send_message(
             chat_id=message.chat.id,
             text=self.context.telegram_renderer.render_start_message_text(
-                is_group_chat=self._check_is_group_chat(message.chat.id), language_code=LanguageCode.EN
+                is_group_chat=is_group_chat, language_code=LanguageCode.EN
             ),
             parse_mode=ParseMode.MARKDOWN,
         )
-        if self._check_is_group_chat(message.chat.id):
-            while not await self.context.telegram_bot.check_is_bot_administrator(message.chat.id):
-                await asyncio.sleep(2)
+        if is_group_chat:
+            if not await self._wait_for_admin_promotion(message.chat.id):
+                logger.warning(f"Bot was not promoted to admin in chat {message.chat.id}")
+                return
 
             await self.context.telegram_bot.edit_message_text(
                 message_id=message.message_id,
                 chat_id=message.chat.id,
                 text=self.context.telegram_renderer.render_start_message_text(
-                    is_group_chat=self._check_is_group_chat(message.chat.id),
+                    is_group_chat=is_group_chat,
                     is_admin_promotion_finished=True, language_code=LanguageCode.EN
                 ),
                 parse_mode=ParseMode.MARKDOWN,
             )
 
-        notification_sink = NotificationSink(recipient_id=str(message.chat.id))
+        notification_sink = NotificationSink(recipient_id=recipient_id)
         await self.context.database_gateway.insert(notification_sink)
         await self.context.telegram_bot.send_message(
             chat_id=message.chat.id,
@@ -192,46 +235,27 @@ class TelegramController(AbstractNotifierController, AsyncInitable):
             ),
         )
 
+    @timed
     async def _handle_help_command(self, message: Message) -> None:
         """/help command handler."""
         notification_sink = await self.context.database_gateway.get_notification_sink(str(message.chat.id))
-        await message.answer(
-            text(
-                _(
-                    "Emoji to problem severity:\n"
-                    "ℹ - info\n"
-                    "😐 - warning\n"
-                    "🔥 - average\n"
-                    "👹 - high\n"
-                    "💀 - disaster\n"
-                    "✅ - problem resolved.\n\n"
-                    "Commands:\n"
-                    "/{} - detailed dashboard analogue\n"
-                    "/{} - subscription settings\n"
-                    "/{} - time zone setting\n"
-                    "/{} - language setting\n",
-                    notification_sink.language_code
-                ).format(
-                    TelegramCommand.GET_CURRENT_PROBLEMS,
-                    TelegramCommand.SUBSCRIPTION_SETTINGS,
-                    TelegramCommand.TIME_ZONE_SETTING,
-                    TelegramCommand.LANGUAGE_SETTING
-                )
-            ),
-            parse_mode=ParseMode.MARKDOWN
-        )
+        await message.answer(render_help_message_text(notification_sink.language_code), parse_mode=ParseMode.MARKDOWN)
 
+    @timed
     async def _handle_get_current_problems_command(self, message: Message) -> None:
         """/currentproblems command handler."""
         chat_id: str = str(message.chat.id)
         notification_sink = await self.context.database_gateway.get_notification_sink(chat_id)
-        unresolved_events = await self.context.controller.get_unresolved_events(notification_sink)
-        time_zone = await self.context.database_gateway.get_notification_sink_time_zone(notification_sink.id)
-        answer = await self._create_unresolved_events_answer(
+        unresolved_events, time_zone = await asyncio.gather(
+            self.context.controller.get_unresolved_events(notification_sink),
+            self.context.database_gateway.get_notification_sink_time_zone(notification_sink.id),
+        )
+        answer_parts = await self._create_unresolved_events_answer(
             unresolved_events, time_zone.code, notification_sink.language_code
         )
-        await self._send_current_problems_answer(chat_id, answer)
+        await self._send_current_problems_answer(chat_id, answer_parts)
 
+    @timed
     async def _handle_subscription_command(self, message: Message) -> None:
         """/subscription command handler."""
         chat_id: str = str(message.chat.id)
@@ -241,19 +265,22 @@ class TelegramController(AbstractNotifierController, AsyncInitable):
         )
         await message.answer(text=_("Subscription settings", notification_sink.language_code), reply_markup=keyboard)
 
+    @timed
     async def _handle_time_zone_command(self, message: Message) -> None:
         """/timezone command handler."""
         notification_sink = await self.context.database_gateway.get_notification_sink(str(message.chat.id))
-        time_zone = await self.context.database_gateway.get_notification_sink_time_zone(notification_sink.id)
+        time_zone, keyboard = await asyncio.gather(
+            self.context.database_gateway.get_notification_sink_time_zone(notification_sink.id),
+            self.context.telegram_keyboard_creator.create_time_zones_keyboard(notification_sink.language_code),
+        )
         await message.answer(
             text=self.context.telegram_renderer.render_time_zones_message_text(
                 time_zone.title, notification_sink.language_code
             ),
-            reply_markup=await self.context.telegram_keyboard_creator.create_time_zones_keyboard(
-                notification_sink.language_code
-            ),
+            reply_markup=keyboard,
         )
 
+    @timed
     async def _handle_language_command(self, message: Message) -> None:
         """/language command handler."""
         notification_sink = await self.context.database_gateway.get_notification_sink(str(message.chat.id))
@@ -268,12 +295,28 @@ class TelegramController(AbstractNotifierController, AsyncInitable):
 
     # Button press handlers:
 
+    @timed
     async def _handle_button_press(self, callback_query: CallbackQuery) -> None:
         """Any button press handler."""
         button_data = cast_button_data(callback_query.data)
-        action = TelegramButtonAction(button_data.action)
-        await self._button_action_to_handler[action](callback_query)
-        await self.context.telegram_bot.answer_callback_query(callback_query.id)
+        handler_name = self._BUTTON_ACTION_TO_HANDLER_NAME.get(button_data.action)
+        answer_task = asyncio.create_task(self.context.telegram_bot.answer_callback_query(callback_query.id))
+        try:
+            if handler_name is None:
+                logger.warning(f"Unknown button action: {button_data.action}")
+                return
+            button_press_key = (callback_query.message.chat.id, callback_query.message.message_id, callback_query.data)
+            if button_press_key in self._button_presses_in_progress:
+                logger.debug(f"Repeated button press ignored while previous is in progress: {button_press_key}")
+                return
+            handler: Callable[[CallbackQuery], Awaitable[None]] = getattr(self, handler_name)
+            self._button_presses_in_progress.add(button_press_key)
+            try:
+                await handler(callback_query)
+            finally:
+                self._button_presses_in_progress.discard(button_press_key)
+        finally:
+            await answer_task
 
     @staticmethod
     async def _no_action_button_handler(_: CallbackQuery) -> None:
@@ -285,10 +328,10 @@ class TelegramController(AbstractNotifierController, AsyncInitable):
         recipient_id = str(callback_query.message.chat.id)
         notification_sink = await self.context.database_gateway.get_notification_sink(recipient_id)
         button_data = cast_button_data(callback_query.data)
-        if button_data.start_message_id is not None:
-            await self.context.telegram_bot.edit_message_text(
+        await asyncio.gather(
+            self._edit_start_message(
                 chat_id=callback_query.message.chat.id,
-                message_id=button_data.start_message_id,
+                start_message_id=button_data.start_message_id,
                 text=self.context.telegram_renderer.render_start_message_text(
                     language_code=notification_sink.language_code,
                     is_group_chat=self._check_is_group_chat(callback_query.message.chat.id),
@@ -297,11 +340,13 @@ class TelegramController(AbstractNotifierController, AsyncInitable):
                     is_time_zone_chosen=True,
                     is_subscription_finished=True,
                 ),
-            )
-        await self.context.telegram_bot.delete_message(
-            chat_id=callback_query.message.chat.id, message_id=callback_query.message.message_id
+            ),
+            self.context.telegram_bot.delete_message(
+                chat_id=callback_query.message.chat.id, message_id=callback_query.message.message_id
+            ),
         )
 
+    @timed
     async def _process_host_group_choosing(self, callback_query: CallbackQuery) -> None:
         """Edit message to host groups choosing message."""
         recipient_id = str(callback_query.message.chat.id)
@@ -310,31 +355,28 @@ class TelegramController(AbstractNotifierController, AsyncInitable):
         await self.context.telegram_bot.edit_message_text(
             chat_id=notification_sink.recipient_id,
             message_id=callback_query.message.message_id,
-            text=_(
-                "{} Monitoring system: Zabbix\n\nAvailable host groups:",
-                notification_sink.language_code
-            ).format(SpecialSymbol.SUBSECTION),
+            text=self.context.telegram_renderer.render_host_groups_choosing_text(notification_sink.language_code),
             reply_markup=await self.context.telegram_keyboard_creator.create_host_groups_keyboard(
                 notification_sink.language_code, start_message_id=button_data.start_message_id,
             )
         )
 
+    @timed
     async def _process_host_choosing(self, callback_query: CallbackQuery) -> None:
         """Edit message to hosts choosing message."""
         recipient_id = str(callback_query.message.chat.id)
         button_data = cast_button_data(callback_query.data)
-        notification_sink = await self.context.database_gateway.get_notification_sink(recipient_id)
-        host_group = await self.context.database_gateway.get_entity_by_id(HostGroup, button_data.entity_id)
+        notification_sink, host_group = await asyncio.gather(
+            self.context.database_gateway.get_notification_sink(recipient_id),
+            self.context.database_gateway.get_entity_by_id(HostGroup, button_data.entity_id),
+        )
 
         await self.context.telegram_bot.edit_message_text(
             chat_id=notification_sink.recipient_id,
             message_id=callback_query.message.message_id,
-            text=_(
-                "{} Monitoring system: Zabbix\n"
-                "{} Host group: {}\n\n"
-                "Available hosts:",
-                notification_sink.language_code,
-            ).format(SpecialSymbol.SUBSECTION, SpecialSymbol.SUBSECTION, host_group.title),
+            text=self.context.telegram_renderer.render_hosts_choosing_text(
+                host_group.title, notification_sink.language_code
+            ),
             reply_markup=await self.context.telegram_keyboard_creator.create_hosts_keyboard(
                 host_group_id=button_data.entity_id,
                 page_number=button_data.page_number if button_data.page_number else 0,
@@ -343,29 +385,21 @@ class TelegramController(AbstractNotifierController, AsyncInitable):
             ),
         )
 
+    @timed
     async def _process_trigger_choosing(self, callback_query: CallbackQuery) -> None:
         """Edit message to triggers choosing message."""
         recipient_id = str(callback_query.message.chat.id)
         button_data = cast_button_data(callback_query.data)
-        notification_sink = await self.context.database_gateway.get_notification_sink(recipient_id)
-        host = await self.context.database_gateway.get_entity_by_id(Host, button_data.entity_id)
-        host_groups = await self.context.database_gateway.get_host_groups_by_host_id(host.id)
+        notification_sink, host, host_groups = await asyncio.gather(
+            self.context.database_gateway.get_notification_sink(recipient_id),
+            self.context.database_gateway.get_entity_by_id(Host, button_data.entity_id),
+            self.context.database_gateway.get_host_groups_by_host_id(button_data.entity_id),
+        )
         await self.context.telegram_bot.edit_message_text(
             chat_id=notification_sink.recipient_id,
             message_id=callback_query.message.message_id,
-            text=_(
-                "{} Monitoring system: Zabbix\n"
-                "{} Host group: "
-                "{}\n"
-                "{} Host: {}\n\n"
-                "Available triggers:",
-                notification_sink.language_code,
-            ).format(
-                SpecialSymbol.SUBSECTION,
-                SpecialSymbol.SUBSECTION,
-                ' | '.join([host_group.title for host_group in host_groups]),
-                SpecialSymbol.SUBSECTION,
-                host.title,
+            text=self.context.telegram_renderer.render_triggers_choosing_text(
+                [host_group.title for host_group in host_groups], host.title, notification_sink.language_code
             ),
             reply_markup=await self.context.telegram_keyboard_creator.create_triggers_keyboard(
                 notification_sink=notification_sink,
@@ -375,49 +409,56 @@ class TelegramController(AbstractNotifierController, AsyncInitable):
             )
         )
 
+    @timed
     async def _process_time_zone_choosing(self, callback_query: CallbackQuery) -> None:
         """Edit message to time zones choosing message."""
         recipient_id = str(callback_query.message.chat.id)
         button_data = cast_button_data(callback_query.data)
         notification_sink = await self.context.database_gateway.get_notification_sink(recipient_id)
-        time_zone = await self.context.database_gateway.get_notification_sink_time_zone(notification_sink.id)
-        try:
-            if button_data.start_message_id:
-                await self.context.telegram_bot.edit_message_text(
-                    chat_id=callback_query.message.chat.id,
-                    message_id=button_data.start_message_id,
-                    text=self.context.telegram_renderer.render_start_message_text(
-                        language_code=notification_sink.language_code,
-                        is_group_chat=self._check_is_group_chat(callback_query.message.chat.id),
-                        is_language_chosen=True,
-                        is_admin_promotion_finished=True,
-                    ),
-                )
-        except Exception:
-            pass
-        await self.context.telegram_bot.edit_message_text(
-            chat_id=recipient_id,
-            message_id=callback_query.message.message_id,
-            text=self.context.telegram_renderer.render_time_zones_message_text(
-                time_zone.title, notification_sink.language_code
-            ),
-            reply_markup=await self.context.telegram_keyboard_creator.create_time_zones_keyboard(
+        time_zone, keyboard = await asyncio.gather(
+            self.context.database_gateway.get_notification_sink_time_zone(notification_sink.id),
+            self.context.telegram_keyboard_creator.create_time_zones_keyboard(
                 language_code=notification_sink.language_code,
                 start_message_id=button_data.start_message_id,
                 page_number=button_data.page_number if button_data.page_number is not None else 0,
             ),
         )
+        await asyncio.gather(
+            self._edit_start_message(
+                chat_id=callback_query.message.chat.id,
+                start_message_id=button_data.start_message_id,
+                text=self.context.telegram_renderer.render_start_message_text(
+                    language_code=notification_sink.language_code,
+                    is_group_chat=self._check_is_group_chat(callback_query.message.chat.id),
+                    is_language_chosen=True,
+                    is_admin_promotion_finished=True,
+                ),
+                ignore_errors=True,
+            ),
+            self.context.telegram_bot.edit_message_text(
+                chat_id=recipient_id,
+                message_id=callback_query.message.message_id,
+                text=self.context.telegram_renderer.render_time_zones_message_text(
+                    time_zone.title, notification_sink.language_code
+                ),
+                reply_markup=keyboard,
+            ),
+        )
 
+    @timed
     async def _process_settings(self, callback_query: CallbackQuery) -> None:
         """Edit message to subscription settings message."""
         notification_sink = await self.context.database_gateway.get_notification_sink(
             str(callback_query.message.chat.id)
         )
         button_data = cast_button_data(callback_query.data)
-        if button_data.start_message_id:
-            await self.context.telegram_bot.edit_message_text(
+        keyboard = await self.context.telegram_keyboard_creator.create_monitoring_systems_keyboard(
+            notification_sink.language_code, button_data.start_message_id
+        )
+        await asyncio.gather(
+            self._edit_start_message(
                 chat_id=callback_query.message.chat.id,
-                message_id=button_data.start_message_id,
+                start_message_id=button_data.start_message_id,
                 text=self.context.telegram_renderer.render_start_message_text(
                     language_code=notification_sink.language_code,
                     is_group_chat=self._check_is_group_chat(callback_query.message.chat.id),
@@ -425,23 +466,22 @@ class TelegramController(AbstractNotifierController, AsyncInitable):
                     is_admin_promotion_finished=True,
                     is_time_zone_chosen=True,
                 ),
-            )
-        await self.context.telegram_bot.edit_message_text(
-            chat_id=callback_query.message.chat.id,
-            message_id=callback_query.message.message_id,
-            text=_("Subscription settings", notification_sink.language_code),
-            reply_markup=await self.context.telegram_keyboard_creator.create_monitoring_systems_keyboard(
-                notification_sink.language_code, button_data.start_message_id
-            )
+            ),
+            self.context.telegram_bot.edit_message_text(
+                chat_id=callback_query.message.chat.id,
+                message_id=callback_query.message.message_id,
+                text=_("Subscription settings", notification_sink.language_code),
+                reply_markup=keyboard,
+            ),
         )
 
     # Other handlers:
 
+    @timed
     async def _handle_new_chat_members(self, message: Message) -> None:
         """Handle adding bot to new chat."""
-        telegram_bot_id = (await self.context.telegram_bot.get_me()).id
         for chat_member in message.new_chat_members:
-            if chat_member.id == telegram_bot_id:
+            if chat_member.id == self._bot_id:
                 await self._handle_start_command(message)
                 break
 
@@ -450,54 +490,89 @@ class TelegramController(AbstractNotifierController, AsyncInitable):
             events: list[MonitoringEvent],
             time_zone_code: str,
             language_code: LanguageCode,
-    ) -> str:
-        """Construct current unresolved events message."""
+    ) -> list[str]:
+        """Construct current unresolved events message parts."""
         if not events:
-            return _("no problems", language_code)
-        answer = _("Current problems:\n\n", language_code)
+            return [_("no problems", language_code)]
+        trigger_id_to_trigger = await self.context.database_gateway.get_entities_by_ids(
+            Trigger, {event.trigger_id for event in events}
+        )
+        host_ids = {trigger.host_id for trigger in trigger_id_to_trigger.values()}
+        host_id_to_host, host_id_to_host_groups = await asyncio.gather(
+            self.context.database_gateway.get_entities_by_ids(Host, host_ids),
+            self.context.database_gateway.get_host_groups_by_host_ids(host_ids),
+        )
+
+        answer_parts = [_("Current problems:\n\n", language_code)]
         for event in events:
-            trigger = await self.context.database_gateway.get_entity_by_id(Trigger, event.trigger_id)
-            host = await self.context.database_gateway.get_entity_by_id(Host, trigger.host_id)
-            host_groups = await self.context.database_gateway.get_host_groups_by_host_id(host.id)
-            event_message: str = await self.context.telegram_renderer.render_event_message_text(
+            trigger = trigger_id_to_trigger[event.trigger_id]
+            event_message_text = self.context.telegram_renderer.render_event_message_text(
                 EventMessageComponents(
                     event=event,
                     trigger=trigger,
-                    host=host,
-                    host_groups=host_groups,
+                    host=host_id_to_host[trigger.host_id],
+                    host_groups=host_id_to_host_groups[trigger.host_id],
                 ),
                 time_zone_code,
                 language_code,
             )
-            answer += f"{event_message}\n"
-        answer = answer.replace("_", "\\_")
-        return answer
-
-    async def _send_current_problems_answer(self, chat_id: str, answer: str) -> None:
-        """Divide current problems message into several messages."""
-        if len(answer) > self.MAX_MESSAGE_LENGTH:
-            event_messages = answer.split("\n\n")
-            answer_part: str = ""
-            for event_message in event_messages:
-                if len(answer_part) + len(event_message) + len("\n\n") > self.MAX_MESSAGE_LENGTH:
-                    await self.context.telegram_bot.send_message(
-                        chat_id=chat_id,
-                        text=answer_part,
-                        parse_mode=ParseMode.MARKDOWN,
-                    )
-                    answer_part = ""
-                answer_part += event_message + "\n\n"
-        else:
-            await self.context.telegram_bot.send_message(chat_id, answer, parse_mode=ParseMode.MARKDOWN)
+            answer_parts.append(event_message_text + "\n")
+        return answer_parts
+
+    async def _send_current_problems_answer(self, chat_id: str, answer_parts: list[str]) -> None:
+        """Pack current problems message parts into as few messages as Telegram allows."""
+        message_parts: list[str] = []
+        message_length = 0
+        for answer_part in answer_parts:
+            answer_part_length = self._get_telegram_text_length(answer_part)
+            if message_parts and message_length + answer_part_length > self.MAX_MESSAGE_LENGTH:
+                await self.context.telegram_bot.send_message(
+                    chat_id=chat_id,
+                    text="".join(message_parts),
+                    parse_mode=ParseMode.MARKDOWN,
+                )
+                message_parts, message_length = [], 0
+            message_parts.append(answer_part)
+            message_length += answer_part_length
+        await self.context.telegram_bot.send_message(
+            chat_id=chat_id,
+            text="".join(message_parts),
+            parse_mode=ParseMode.MARKDOWN,
+        )
 
     # utilities:
 
+    async def _edit_start_message(
+            self,
+            chat_id: int,
+            start_message_id: int | None,
+            text: str,
+            ignore_errors: bool = False,
+    ) -> None:
+        """Edit start message settings checklist if settings were opened from it."""
+        if not start_message_id:
+            return
+        try:
+            await self.context.telegram_bot.edit_message_text(chat_id=chat_id, message_id=start_message_id, text=text)
+        except Exception:
+            if not ignore_errors:
+                raise
+
+    async def _wait_for_admin_promotion(self, chat_id: int) -> bool:
+        """Wait with growing check delays until bot is promoted to admin in chat."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.ADMIN_PROMOTION_TIMEOUT_SEC
+        delay = 1.0
+        while not await self.context.telegram_bot.check_is_bot_administrator(chat_id):
+            if loop.time() + delay > deadline:
+                return False
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.6, self.ADMIN_PROMOTION_MAX_CHECK_DELAY_SEC)
+        return True
+
     async def _set_default_commands(self) -> None:
         """Set default commands in new chat."""
-        bot_commands: list[BotCommand] = []
-        for command, description in TELEGRAM_COMMAND_TO_DESCRIPTION.items():
-            bot_commands.append(BotCommand(command=command, description=description))
-        await self.context.telegram_dispatcher.bot.set_my_commands(bot_commands)
+        await self.context.telegram_dispatcher.bot.set_my_commands(DEFAULT_BOT_COMMANDS)
 
     # database utilities:
 
@@ -506,22 +581,25 @@ class TelegramController(AbstractNotifierController, AsyncInitable):
         recipient_id = str(callback_query.message.chat.id)
         button_data = cast_button_data(callback_query.data)
         notification_sink = await self.context.database_gateway.get_notification_sink(recipient_id)
-        await self.context.database_gateway.update_notification_sink_time_zone_id(
-            notification_sink_id=notification_sink.id,
-            time_zone_id=button_data.entity_id,
+        time_zone, keyboard, _time_zone_updated = await asyncio.gather(
+            self.context.database_gateway.get_entity_by_id(TimeZone, button_data.entity_id),
+            self.context.telegram_keyboard_creator.create_time_zones_keyboard(
+                language_code=notification_sink.language_code,
+                page_number=button_data.page_number,
+                start_message_id=button_data.start_message_id,
+            ),
+            self.context.database_gateway.update_notification_sink_time_zone_id(
+                notification_sink_id=notification_sink.id,
+                time_zone_id=button_data.entity_id,
+            ),
         )
-        time_zone = await self.context.database_gateway.get_notification_sink_time_zone(notification_sink.id)
         await self.context.telegram_bot.edit_message_text(
             chat_id=recipient_id,
             message_id=callback_query.message.message_id,
             text=self.context.telegram_renderer.render_time_zones_message_text(
                 time_zone.title, notification_sink.language_code
             ),
-            reply_markup=await self.context.telegram_keyboard_creator.create_time_zones_keyboard(
-                language_code=notification_sink.language_code,
-                page_number=button_data.page_number,
-                start_message_id=button_data.start_message_id,
-            ),
+            reply_markup=keyboard,
         )
 
     async def _set_language(self, callback_query: CallbackQuery) -> None:
@@ -533,26 +611,28 @@ class TelegramController(AbstractNotifierController, AsyncInitable):
             notification_sink_id=notification_sink.id,
             language_code=button_data.entity_id,
         )
-        language_code = await self.context.database_gateway.get_notification_sink_language_code(notification_sink.id)
-        if button_data.start_message_id:
-            await self.context.telegram_bot.edit_message_text(
+        language_code = LanguageCode(button_data.entity_id)
+        keyboard = await self.context.telegram_keyboard_creator.create_languages_keyboard(
+            language_code=language_code,
+            start_message_id=button_data.start_message_id,
+        )
+        await asyncio.gather(
+            self._edit_start_message(
                 chat_id=callback_query.message.chat.id,
-                message_id=button_data.start_message_id,
+                start_message_id=button_data.start_message_id,
                 text=self.context.telegram_renderer.render_start_message_text(
                     language_code=language_code,
                     is_group_chat=self._check_is_group_chat(callback_query.message.chat.id),
                     is_admin_promotion_finished=True,
                 ),
-            )
-        await self.context.telegram_bot.edit_message_text(
-            chat_id=recipient_id,
-            message_id=callback_query.message.message_id,
-            text=self.context.telegram_renderer.render_languages_message_text(
-                LANGUAGE_CODE_TO_TITLE[language_code], language_code
             ),
-            reply_markup=await self.context.telegram_keyboard_creator.create_languages_keyboard(
-                language_code=language_code,
-                start_message_id=button_data.start_message_id,
+            self.context.telegram_bot.edit_message_text(
+                chat_id=recipient_id,
+                message_id=callback_query.message.message_id,
+                text=self.context.telegram_renderer.render_languages_message_text(
+                    LANGUAGE_CODE_TO_TITLE[language_code], language_code
+                ),
+                reply_markup=keyboard,
             ),
         )
 
@@ -624,8 +704,10 @@ class TelegramController(AbstractNotifierController, AsyncInitable):
     async def _subscribe_to_monitoring_system(self, callback_query: CallbackQuery) -> None:
         """Subscribe user to all triggers in monitoring system."""
         recipient_id = str(callback_query.message.chat.id)
-        notification_sink = await self.context.database_gateway.get_notification_sink(recipient_id)
-        triggers_len = await self.context.controller.subscribe_to_monitoring_system_triggers(recipient_id)
+        notification_sink, triggers_len = await asyncio.gather(
+            self.context.database_gateway.get_notification_sink(recipient_id),
+            self.context.controller.subscribe_to_monitoring_system_triggers(recipient_id),
+        )
         await self.context.telegram_bot.send_message(
             chat_id=recipient_id,
             text=_("subscribed to {} Zabbix triggers", notification_sink.language_code).format(triggers_len),
@@ -655,6 +737,11 @@ class TelegramController(AbstractNotifierController, AsyncInitable):
         )
         await self.update_triggers_message(notification_sink, button_data, message_id)
 
+    @staticmethod
+    def _get_telegram_text_length(message_text: str) -> int:
+        """Get text length in UTF-16 code units as Telegram counts message length limit."""
+        return len(message_text.encode("utf-16-le")) // 2
+
     @staticmethod
     def _check_is_group_chat(chat_id: int) -> bool:
         """Check is current chat a group chat."""
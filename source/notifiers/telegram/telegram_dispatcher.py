@@ -2,25 +2,67 @@
 import asyncio
 import logging
 from dataclasses import dataclass
+from typing import Optional
+
 from aiogram import Dispatcher
 from aiogram.contrib.fsm_storage.memory import MemoryStorage
+from aiogram.dispatcher.webhook import get_new_configured_app
+from aiohttp import web
+from async_tools import AsyncDeinitable, AsyncInitable
 
 from notifiers.telegram.telegram_bot import TelegramBot
 
 logger = logging.getLogger(__name__)
 
 
-class TelegramDispatcher(Dispatcher):
+class TelegramDispatcher(Dispatcher, AsyncInitable, AsyncDeinitable):
     """Telegram dispatcher."""
 
+    @dataclass
+    class Config:
+        """config."""
+
+        webhook_url: Optional[str] = None
+        webhook_path: str = "/telegram/webhook"
+        webhook_host: str = "0.0.0.0"
+        webhook_port: int = 8080
+
     @dataclass
     class Context:
         """context."""
 
         telegram_bot: TelegramBot
 
-    def __init__(self, context: Context):
+    def __init__(self, config: Config, context: Context):
         """init."""
         super().__init__(context.telegram_bot, storage=MemoryStorage())
-        asyncio.create_task(self.start_polling())
+        AsyncInitable.__init__(self)
+        AsyncDeinitable.__init__(self)
+        self.config = config
+        self._polling_task: asyncio.Task | None = None
+        self._webhook_runner: web.AppRunner | None = None
         logger.info(f"{type(self).__name__} inited")
+
+    async def _async_init(self) -> None:
+        """Start receiving updates by webhook if it is configured, otherwise by polling."""
+        if self.config.webhook_url is None:
+            self._polling_task = asyncio.create_task(self.start_polling())
+            return
+
+        self._webhook_runner = web.AppRunner(get_new_configured_app(self, self.config.webhook_path))
+        await self._webhook_runner.setup()
+        await web.TCPSite(self._webhook_runner, self.config.webhook_host, self.config.webhook_port).start()
+        await self.bot.set_webhook(f"{self.config.webhook_url.rstrip('/')}{self.config.webhook_path}")
+        logger.info(f"Receiving updates by webhook on port {self.config.webhook_port}")
+
+    async def _async_deinit(self) -> None:
+        """Stop receiving updates on application stop."""
+        if self._polling_task is not None:
+            self.stop_polling()
+            self._polling_task.cancel()
+            self._polling_task = None
+
+        if self._webhook_runner is not None:
+            await self.bot.delete_webhook()
+            await self._webhook_runner.cleanup()
+            self._webhook_runner = None
@@ -1,9 +1,12 @@
 """TelegramKeyboardCreator module."""
+import asyncio
+import functools
 import logging
+import time
 from dataclasses import dataclass
 from enum import unique, StrEnum
 from math import ceil
-from typing import Optional
+from typing import Optional, TypeVar
 
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 
@@ -19,6 +22,8 @@ from utils.translation import _, LanguageCode, LanguageTitle
 
 logger = logging.getLogger(__name__)
 
+Entity = TypeVar("Entity")
+
 
 @unique
 class TelegramButtonAction(StrEnum):
@@ -66,23 +71,37 @@ class TelegramButtonData:
 
     def __str__(self):
         """str."""
-        return f"{self.action}|" \
-               f"{self.entity_id if self.entity_id is not None else ''}|" \
-               f"{self.mute_code if self.mute_code is not None else ''}|" \
-               f"{self.page_number if self.page_number is not None else ''}|" \
-               f"{self.start_message_id if self.start_message_id is not None else ''}"
+        return _serialize_button_data(
+            self.action, self.entity_id, self.mute_code, self.page_number, self.start_message_id
+        )
+
+
+@functools.lru_cache(maxsize=8192)
+def _serialize_button_data(
+        action: str,
+        entity_id: Optional[int | LanguageCode],
+        mute_code: Optional[str],
+        page_number: Optional[int],
+        start_message_id: Optional[int],
+) -> str:
+    """Serialize button data to callback data string."""
+    return "|".join((
+        action,
+        "" if entity_id is None else str(entity_id),
+        mute_code or "",
+        "" if page_number is None else str(page_number),
+        "" if start_message_id is None else str(start_message_id),
+    ))
 
 
 def cast_button_data(unformed_button_data: str) -> TelegramButtonData:
     """Cast button data."""
-    button_data_attributes = unformed_button_data.split("|")
-    try:
-        entity_id = int(button_data_attributes[1])
-    except Exception:
-        if isinstance(button_data_attributes[1], str):
-            entity_id = button_data_attributes[1]
-        else:
-            entity_id = None
+    button_data_attributes = unformed_button_data.split("|", 4)
+    unformed_entity_id = button_data_attributes[1]
+    if unformed_entity_id.removeprefix("-").isdecimal():
+        entity_id = int(unformed_entity_id)
+    else:
+        entity_id = unformed_entity_id or None
 
     return TelegramButtonData(
         action=button_data_attributes[0],
@@ -104,10 +123,13 @@ class TelegramKeyboardCreator:
         database_gateway: DatabaseGateway
 
     MAX_KEYBOARD_HEIGHT = 14
+    ENTITIES_CACHE_TTL_SEC = 60
 
     def __init__(self, context: Context):
         """init."""
         self.context = context
+        self._entity_type_to_cached_entities: dict[type, tuple[float, list]] = {}
+        self._host_group_id_to_cached_sorted_hosts: dict[int, tuple[float, list[Host]]] = {}
 
     async def create_monitoring_systems_keyboard(
             self,
@@ -215,7 +237,7 @@ class TelegramKeyboardCreator:
             start_message_id: Optional[int] = None,
     ) -> InlineKeyboardMarkup:
         """Create host groups subscription keyboard."""
-        host_groups = await self.context.database_gateway.select(HostGroup)
+        host_groups = await self._select_cached(HostGroup)
         inline_keyboard = InlineKeyboardMarkup(row_width=2)
         for host_group in host_groups:
             inline_keyboard.add(
@@ -252,9 +274,8 @@ class TelegramKeyboardCreator:
             start_message_id: Optional[int] = None,
     ) -> InlineKeyboardMarkup:
         """Create hosts subscription keyboard."""
-        hosts = await self.context.database_gateway.select(Host)
-        sorted_hosts = self._sort_hosts_by_host_titles(hosts)
-        pages_amount = ceil(len(hosts) / self.MAX_KEYBOARD_HEIGHT)
+        sorted_hosts = await self._get_sorted_hosts(host_group_id)
+        pages_amount = ceil(len(sorted_hosts) / self.MAX_KEYBOARD_HEIGHT)
         inline_keyboard = InlineKeyboardMarkup(resize_keyboard=True)
         for host in sorted_hosts[page_number * self.MAX_KEYBOARD_HEIGHT: (page_number + 1) * self.MAX_KEYBOARD_HEIGHT]:
             inline_keyboard.add(
@@ -322,12 +343,13 @@ class TelegramKeyboardCreator:
             start_message_id: Optional[int] = None,
     ) -> InlineKeyboardMarkup:
         """Create triggers subscription keyboard."""
-        triggers = await self.context.database_gateway.get_triggers_by_host_id(host_id)
+        triggers, subscribed_triggers, host_groups = await asyncio.gather(
+            self.context.database_gateway.get_triggers_by_host_id(host_id),
+            self.context.database_gateway.get_triggers_by_notification_sink_id(notification_sink.id),
+            self.context.database_gateway.get_host_groups_by_host_id(host_id),
+        )
         triggers.sort(key=lambda host: host.title)
         pages_amount = ceil(len(triggers) / self.MAX_KEYBOARD_HEIGHT)
-        subscribed_triggers = await self.context.database_gateway.get_triggers_by_notification_sink_id(
-            notification_sink.id
-        )
         subscribed_trigger_ids = {subscribed_trigger.id for subscribed_trigger in subscribed_triggers}
         inline_keyboard = InlineKeyboardMarkup(resize_keyboard=True)
         for trigger in triggers[page_number * self.MAX_KEYBOARD_HEIGHT: (page_number + 1) * self.MAX_KEYBOARD_HEIGHT]:
@@ -370,7 +392,6 @@ class TelegramKeyboardCreator:
                 ),
             )
         )
-        host_groups = await self.context.database_gateway.get_host_groups_by_host_id(host_id)
         inline_keyboard.add(
             InlineKeyboardButton(
                 text=_("{} Back to hosts", notification_sink.language_code).format(SpecialSymbol.BACK),
@@ -393,7 +414,7 @@ class TelegramKeyboardCreator:
             start_message_id: Optional[int] = None,
     ) -> InlineKeyboardMarkup:
         """Create time zone change keyboard."""
-        time_zones = await self.context.database_gateway.select(TimeZone)
+        time_zones = await self._select_cached(TimeZone)
         pages_amount = ceil(len(time_zones) / self.MAX_KEYBOARD_HEIGHT)
         page = time_zones[page_number * self.MAX_KEYBOARD_HEIGHT: (page_number + 1) * self.MAX_KEYBOARD_HEIGHT]
         inline_keyboard = InlineKeyboardMarkup(resize_keyboard=True)
@@ -502,30 +523,42 @@ class TelegramKeyboardCreator:
         )
         return inline_keyboard
 
-    def _sort_hosts_by_host_titles(self, hosts: list[Host]) -> list[Host]:
-        """Sort hosts for hosts keyboard."""
-        host_title_to_host = {host.title: host for host in hosts}
-        host_titles = set(host_title_to_host)
-        not_ip_address_host_titles = {host_title for host_title in host_titles
-                                      if not self._is_str_ip_address(host_title)}
-        sorted_hosts = [host_title_to_host[host_title] for host_title in not_ip_address_host_titles]
-        sorted_hosts.sort(key=lambda host: host.title)
-
-        ip_address_host_titles = host_titles - not_ip_address_host_titles
-        ip_address_hosts = [host_title_to_host[host_title] for host_title in ip_address_host_titles]
-        ip_address_hosts.sort(key=lambda host: self._cast_ip_address_value(host.title))
-        sorted_hosts += ip_address_hosts
+    async def _select_cached(self, entity_type: type[Entity]) -> list[Entity]:
+        """Select rarely changing entities from DB at most once per cache TTL."""
+        cached_at, entities = self._entity_type_to_cached_entities.get(entity_type, (None, None))
+        if cached_at is not None and time.monotonic() - cached_at < self.ENTITIES_CACHE_TTL_SEC:
+            return entities
+
+        entities = await self.context.database_gateway.select(entity_type)
+        self._entity_type_to_cached_entities[entity_type] = (time.monotonic(), entities)
+        return entities
 
+    async def _get_sorted_hosts(self, host_group_id: int) -> list[Host]:
+        """Get host group hosts sorted for hosts keyboard, reselecting them at most once per cache TTL."""
+        cached_at, sorted_hosts = self._host_group_id_to_cached_sorted_hosts.get(host_group_id, (None, None))
+        if cached_at is not None and time.monotonic() - cached_at < self.ENTITIES_CACHE_TTL_SEC:
+            return sorted_hosts
+
+        hosts = await self.context.database_gateway.get_hosts_by_host_group_id(host_group_id)
+        sorted_hosts = self._sort_hosts_by_host_titles(hosts)
+        self._host_group_id_to_cached_sorted_hosts[host_group_id] = (time.monotonic(), sorted_hosts)
         return sorted_hosts
 
+    def _sort_hosts_by_host_titles(self, hosts: list[Host]) -> list[Host]:
+        """Sort hosts for hosts keyboard: named hosts by title, then ip address hosts by address value."""
+        def get_host_sort_key(host: Host) -> tuple[int, str | int]:
+            if self._is_str_ip_address(host.title):
+                return 1, self._cast_ip_address_value(host.title)
+            return 0, host.title
+
+        return sorted(hosts, key=get_host_sort_key)
+
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _cast_ip_address_value(ip_address: str) -> int:
         """Cast ip address value for hosts sorting."""
-        unformed_left_values = list(map(int, ip_address.split(":")[0].split(".")))
-        first = unformed_left_values[0] * 256 ** 3
-        second = unformed_left_values[1] * 256 ** 2
-        third = unformed_left_values[2] * 256 ** 1 + unformed_left_values[3]
-        return first + second + third
+        first, second, third, fourth = map(int, ip_address.partition(":")[0].split("."))
+        return (first << 24) + (second << 16) + (third << 8) + fourth
 
     @staticmethod
     def _is_str_ip_address(string_to_check: str) -> bool:
@@ -574,6 +607,7 @@ class TelegramKeyboardCreator:
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=512)
     def _create_finish_button(
             language_code: LanguageCode,
             start_message_id: Optional[int] = None,
@@ -587,6 +621,7 @@ class TelegramKeyboardCreator:
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=512)
     def _create_separator_button(start_message_id: Optional[int] = None) -> InlineKeyboardButton:
         """Create empty button for separation."""
         return InlineKeyboardButton(
@@ -597,6 +632,7 @@ class TelegramKeyboardCreator:
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=512)
     def _create_back_to_subscription_settings_button(
             language_code: LanguageCode,
             start_message_id: Optional[int] = None,
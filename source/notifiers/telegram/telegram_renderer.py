@@ -2,7 +2,6 @@
 import datetime
 import logging
 from enum import StrEnum
-from typing import Optional
 
 from notifiers.abstract_notifier_controller import EventMessageComponents
 from monitoring_systems.abstract_monitoring_system_controller import MonitoringEvent
@@ -12,6 +11,8 @@ from utils.translation import _, LanguageCode, LanguageTitle
 
 logger = logging.getLogger(__name__)
 
+MARKDOWN_ESCAPE_TABLE = str.maketrans({"_": "\\_", "*": "\\*", "[": "\\[", "`": "\\`"})
+
 
 class TelegramCommand(StrEnum):
     """TelegramCommand."""
@@ -46,21 +47,23 @@ class TelegramRenderer:
         }
         logger.info(f"{type(self).__name__} inited")
 
-    async def render_event_message_text(
+    def render_event_message_text(
             self,
             event_message_components: EventMessageComponents,
             time_zone_code: str,
             language_code: LanguageCode,
-    ) -> Optional[str]:
+    ) -> str:
         """Render event message text."""
         emoji = self._severity_id_to_emoji[event_message_components.trigger.severity]
         caption = self._render_caption(
             event_message_components.event, event_message_components.trigger.severity, language_code
         )
         event_origin = self._render_event_origin(
-            trigger_title=event_message_components.trigger.title,
-            host_title=event_message_components.host.title,
-            host_group_titles=[host_group.title for host_group in event_message_components.host_groups],
+            trigger_title=event_message_components.trigger.title.translate(MARKDOWN_ESCAPE_TABLE),
+            host_title=event_message_components.host.title.translate(MARKDOWN_ESCAPE_TABLE),
+            host_group_titles=[
+                host_group.title.translate(MARKDOWN_ESCAPE_TABLE) for host_group in event_message_components.host_groups
+            ],
             monitoring_system_title="Zabbix",
             language_code=language_code,
         )
@@ -72,8 +75,7 @@ class TelegramRenderer:
             message += _(
                 "{} Description: {}\n",
                 language_code
-            ).format(SpecialSymbol.SECTION, event_message_components.event.opdata)
-        message = message.replace("_", "\\_")
+            ).format(SpecialSymbol.SECTION, event_message_components.event.opdata.translate(MARKDOWN_ESCAPE_TABLE))
         return message
 
     @staticmethod
@@ -186,6 +188,46 @@ class TelegramRenderer:
             )
         return message_text
 
+    @staticmethod
+    def render_host_groups_choosing_text(language_code: LanguageCode) -> str:
+        """Render host groups choosing message text."""
+        return _(
+            "{} Monitoring system: Zabbix\n\nAvailable host groups:",
+            language_code
+        ).format(SpecialSymbol.SUBSECTION)
+
+    @staticmethod
+    def render_hosts_choosing_text(host_group_title: str, language_code: LanguageCode) -> str:
+        """Render hosts choosing message text."""
+        return _(
+            "{} Monitoring system: Zabbix\n"
+            "{} Host group: {}\n\n"
+            "Available hosts:",
+            language_code,
+        ).format(SpecialSymbol.SUBSECTION, SpecialSymbol.SUBSECTION, host_group_title)
+
+    @staticmethod
+    def render_triggers_choosing_text(
+            host_group_titles: list[str],
+            host_title: str,
+            language_code: LanguageCode,
+    ) -> str:
+        """Render triggers choosing message text."""
+        return _(
+            "{} Monitoring system: Zabbix\n"
+            "{} Host group: "
+            "{}\n"
+            "{} Host: {}\n\n"
+            "Available triggers:",
+            language_code,
+        ).format(
+            SpecialSymbol.SUBSECTION,
+            SpecialSymbol.SUBSECTION,
+            HOST_GROUP_COMBINER.join(host_group_titles),
+            SpecialSymbol.SUBSECTION,
+            host_title,
+        )
+
     @staticmethod
     def render_time_zones_message_text(time_zone_title: str, language_code: LanguageCode) -> str:
         """Render current user time zone text."""
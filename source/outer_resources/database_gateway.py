@@ -1,10 +1,11 @@
 """DatabaseGateway module."""
 import logging
+from collections import defaultdict
 from dataclasses import dataclass
 
-from typing import TypeVar
+from typing import AsyncIterator, TypeVar
 
-from sqlalchemy import select, update, delete
+from sqlalchemy import delete, insert, literal, select, update
 from sqlalchemy_tools.database_connector.database_session_maker import DatabaseSessionMaker
 
 from entities.monitoring_system_structure.host import Host
@@ -35,6 +36,11 @@ class DatabaseGateway:
         """init."""
         self.context = context
         self.ensure_session = self.context.database_session_maker.ensure_session
+        self._trigger_id_to_notification_sinks: dict[int, list[NotificationSink]] = {}
+        self._recipient_id_to_notification_sink: dict[str, NotificationSink] = {}
+        self._notification_sink_id_to_time_zone: dict[int, TimeZone] = {}
+        self._notification_sinks_cache_generation = 0
+        self._trigger_id_to_host_id: dict[int, int] = {}
         logger.info(f"{type(self).__name__} inited")
 
     # SELECT
@@ -46,6 +52,14 @@ class DatabaseGateway:
             query = query.where(entity_type.id > 0)
             return (await session.execute(query)).scalars().all()
 
+    async def iterate(self, entity_type: type[Entity], batch_size: int = 1000) -> AsyncIterator[Entity]:
+        """Stream entities from DB by batches."""
+        async with self.ensure_session() as session:
+            query = select(entity_type)
+            query = query.where(entity_type.id > 0).execution_options(yield_per=batch_size)
+            async for entity in await session.stream_scalars(query):
+                yield entity
+
     async def get_entity_by_id(self, entity_type: type[Entity], entity_id: int) -> Entity:
         """Select entity by id from DB."""
         async with self.ensure_session() as session:
@@ -56,8 +70,21 @@ class DatabaseGateway:
             )
             return (await session.execute(query)).scalar()
 
+    async def get_entities_by_ids(self, entity_type: type[Entity], entity_ids: set[int]) -> dict[int, Entity]:
+        """Select entities by ids from DB."""
+        async with self.ensure_session() as session:
+            query = select(
+                entity_type
+            ).where(
+                entity_type.id.in_(entity_ids)
+            )
+            return {entity.id: entity for entity in (await session.execute(query)).scalars()}
+
     async def get_host_id_by_trigger_id(self, trigger_id: int) -> int:
-        """Select host id by trigger id from DB."""
+        """Select host id by trigger id from cache or DB (trigger never moves to another host)."""
+        if (host_id := self._trigger_id_to_host_id.get(trigger_id)) is not None:
+            return host_id
+
         async with self.ensure_session() as session:
             query = select(
                 Host.id
@@ -66,7 +93,32 @@ class DatabaseGateway:
             ).where(
                 Trigger.id == trigger_id
             )
-            return (await session.execute(query)).scalar()
+            host_id = (await session.execute(query)).scalar()
+
+        if host_id is not None:
+            self._trigger_id_to_host_id[trigger_id] = host_id
+        return host_id
+
+    async def get_trigger_origin(self, trigger_id: int) -> tuple[Trigger, Host, list[HostGroup]]:
+        """Select trigger with its host and host groups by trigger id from DB."""
+        async with self.ensure_session() as session:
+            query = select(
+                Trigger, Host, HostGroup
+            ).join(
+                Host, Host.id == Trigger.host_id
+            ).outerjoin(
+                HostToHostGroup, HostToHostGroup.host_id == Host.id
+            ).outerjoin(
+                HostGroup, HostGroup.id == HostToHostGroup.host_group_id
+            ).where(
+                Trigger.id == trigger_id
+            )
+            rows = (await session.execute(query)).all()
+
+        if not rows:
+            raise LookupError(f"Trigger {trigger_id} not found")
+        trigger, host, _ = rows[0]
+        return trigger, host, [host_group for _, _, host_group in rows if host_group is not None]
 
     async def get_hosts_by_host_group_id(self, host_group_id: int) -> list[Host]:
         """Select hosts by host group id from DB."""
@@ -82,6 +134,19 @@ class DatabaseGateway:
             )
             return (await session.execute(query)).scalars().all()
 
+    async def get_host_group_id_to_hosts(self) -> dict[int, list[Host]]:
+        """Select hosts grouped by host group id from DB."""
+        async with self.ensure_session() as session:
+            query = select(
+                HostToHostGroup.host_group_id, Host
+            ).join(
+                Host, Host.id == HostToHostGroup.host_id
+            )
+            host_group_id_to_hosts: dict[int, list[Host]] = defaultdict(list)
+            for host_group_id, host in await session.execute(query):
+                host_group_id_to_hosts[host_group_id].append(host)
+            return dict(host_group_id_to_hosts)
+
     async def get_host_groups_by_host_id(self, host_id: int) -> list[HostGroup]:
         """Select host groups by host id from DB."""
         async with self.ensure_session() as session:
@@ -96,6 +161,21 @@ class DatabaseGateway:
             )
             return (await session.execute(query)).scalars().all()
 
+    async def get_host_groups_by_host_ids(self, host_ids: set[int]) -> dict[int, list[HostGroup]]:
+        """Select host groups grouped by host ids from DB."""
+        async with self.ensure_session() as session:
+            query = select(
+                HostToHostGroup.host_id, HostGroup
+            ).join(
+                HostGroup, HostGroup.id == HostToHostGroup.host_group_id
+            ).where(
+                HostToHostGroup.host_id.in_(host_ids)
+            )
+            host_id_to_host_groups: dict[int, list[HostGroup]] = {host_id: [] for host_id in host_ids}
+            for host_id, host_group in await session.execute(query):
+                host_id_to_host_groups[host_id].append(host_group)
+            return host_id_to_host_groups
+
     async def get_triggers_by_host_id(self, host_id: int) -> list[Trigger]:
         """Select triggers by host id from DB."""
         async with self.ensure_session() as session:
@@ -119,29 +199,62 @@ class DatabaseGateway:
             return (await session.execute(query)).scalars().all()
 
     async def get_notification_sinks_by_trigger_id(self, trigger_id: int) -> list[NotificationSink]:
-        """Select notification_sinks by trigger id from DB."""
+        """Select notification_sinks by trigger id from cache or DB."""
+        return (await self.get_notification_sinks_by_trigger_ids({trigger_id}))[trigger_id]
+
+    async def get_notification_sinks_by_trigger_ids(self, trigger_ids: set[int]) -> dict[int, list[NotificationSink]]:
+        """Select notification_sinks grouped by trigger ids from cache or DB."""
+        trigger_id_to_notification_sinks = {
+            trigger_id: self._trigger_id_to_notification_sinks[trigger_id]
+            for trigger_id in trigger_ids
+            if trigger_id in self._trigger_id_to_notification_sinks
+        }
+        missing_trigger_ids = trigger_ids - trigger_id_to_notification_sinks.keys()
+        if not missing_trigger_ids:
+            return trigger_id_to_notification_sinks
+
+        cache_generation = self._notification_sinks_cache_generation
+        fetched_trigger_id_to_notification_sinks = {trigger_id: [] for trigger_id in missing_trigger_ids}
         async with self.ensure_session() as session:
             query = select(
-                NotificationSink
+                NotificationSinkToTrigger.trigger_id, NotificationSink
             ).join(
-                NotificationSinkToTrigger, NotificationSinkToTrigger.notification_sink_id == NotificationSink.id,
+                NotificationSink, NotificationSink.id == NotificationSinkToTrigger.notification_sink_id,
             ).where(
-                NotificationSinkToTrigger.trigger_id == trigger_id
+                NotificationSinkToTrigger.trigger_id.in_(missing_trigger_ids)
             )
-            return (await session.execute(query)).scalars().all()
+            for trigger_id, notification_sink in await session.execute(query):
+                fetched_trigger_id_to_notification_sinks[trigger_id].append(notification_sink)
+
+        if cache_generation == self._notification_sinks_cache_generation:
+            self._trigger_id_to_notification_sinks.update(fetched_trigger_id_to_notification_sinks)
+        trigger_id_to_notification_sinks.update(fetched_trigger_id_to_notification_sinks)
+        return trigger_id_to_notification_sinks
 
     async def get_notification_sink(self, recipient_id: str) -> NotificationSink:
-        """Select notification_sink from DB."""
+        """Select notification_sink from cache or DB."""
+        if (notification_sink := self._recipient_id_to_notification_sink.get(recipient_id)) is not None:
+            return notification_sink
+
+        cache_generation = self._notification_sinks_cache_generation
         async with self.ensure_session() as session:
             query = select(
                 NotificationSink
             ).where(
                 NotificationSink.recipient_id == recipient_id
             )
-            return (await session.execute(query)).scalar()
+            notification_sink = (await session.execute(query)).scalar()
+
+        if notification_sink is not None and cache_generation == self._notification_sinks_cache_generation:
+            self._recipient_id_to_notification_sink[recipient_id] = notification_sink
+        return notification_sink
 
     async def get_notification_sink_time_zone(self, notification_sink_id: int) -> TimeZone:
-        """Select notification sinks time zone from DB."""
+        """Select notification sinks time zone from cache or DB."""
+        if (time_zone := self._notification_sink_id_to_time_zone.get(notification_sink_id)) is not None:
+            return time_zone
+
+        cache_generation = self._notification_sinks_cache_generation
         async with self.ensure_session() as session:
             query = select(
                 TimeZone
@@ -150,23 +263,17 @@ class DatabaseGateway:
             ).where(
                 NotificationSink.id == notification_sink_id
             )
-            return (await session.execute(query)).scalar()
+            time_zone = (await session.execute(query)).scalar()
 
-    async def get_notification_sink_language_code(self, notification_sink_id: int) -> LanguageCode:
-        """Select notification sinks time zone from DB."""
-        async with self.ensure_session() as session:
-            query = select(
-                NotificationSink.language_code
-            ).where(
-                NotificationSink.id == notification_sink_id
-            )
-            return (await session.execute(query)).scalar()
+        if time_zone is not None and cache_generation == self._notification_sinks_cache_generation:
+            self._notification_sink_id_to_time_zone[notification_sink_id] = time_zone
+        return time_zone
 
     # INSERT
 
-    async def insert(self, entities: Entity | list[Entity]) -> None:
+    async def insert(self, entities: Entity | list[Entity] | tuple[Entity, ...]) -> None:
         """Insert entities to DB."""
-        if not isinstance(entities, list):
+        if not isinstance(entities, (list, tuple)):
             entities = [entities]
 
         async with self.ensure_session() as session:
@@ -174,6 +281,39 @@ class DatabaseGateway:
                 session.add(entity)
             await session.flush()
 
+        if any(isinstance(entity, NotificationSinkToTrigger) for entity in entities):
+            self._invalidate_notification_sinks_cache()
+
+    async def insert_missing_notification_sink_to_triggers(
+            self,
+            notification_sink_id: int,
+            trigger_ids: list[int],
+    ) -> int:
+        """Insert notification sink to triggers that are not in DB yet and return inserted amount."""
+        async with self.ensure_session() as session:
+            subscribed_trigger_ids = select(
+                NotificationSinkToTrigger.trigger_id
+            ).where(
+                NotificationSinkToTrigger.notification_sink_id == notification_sink_id
+            )
+            query = insert(
+                NotificationSinkToTrigger
+            ).from_select(
+                [NotificationSinkToTrigger.notification_sink_id, NotificationSinkToTrigger.trigger_id],
+                select(
+                    literal(notification_sink_id), Trigger.id
+                ).where(
+                    Trigger.id.in_(trigger_ids),
+                    Trigger.id.not_in(subscribed_trigger_ids),
+                ),
+            ).returning(
+                NotificationSinkToTrigger.trigger_id
+            )
+            inserted_amount = len((await session.execute(query)).all())
+
+        self._invalidate_notification_sinks_cache()
+        return inserted_amount
+
     # UPDATE
 
     async def enable_host_groups(self, host_group_ids: list[int]) -> None:
@@ -216,6 +356,8 @@ class DatabaseGateway:
             )
             await session.execute(query)
 
+        self._invalidate_notification_sinks_cache()
+
     async def update_notification_sink_language_code(
             self,
             notification_sink_id: int,
@@ -232,6 +374,8 @@ class DatabaseGateway:
             )
             await session.execute(query)
 
+        self._invalidate_notification_sinks_cache()
+
     # DELETE:
 
     async def delete_notification_sink_to_trigger_by_id(self, notification_sink_id: int, trigger_id: int) -> None:
@@ -247,6 +391,8 @@ class DatabaseGateway:
             )
             await session.execute(query)
 
+        self._invalidate_notification_sinks_cache()
+
     async def delete_notification_sink_to_trigger(self, notification_sink_id: int) -> None:
         """Delete notification sink to trigger from DB."""
         async with self.ensure_session() as session:
@@ -258,3 +404,12 @@ class DatabaseGateway:
                 synchronize_session=False
             )
             await session.execute(query)
+
+        self._invalidate_notification_sinks_cache()
+
+    def _invalidate_notification_sinks_cache(self) -> None:
+        """Drop cached notification sinks after their subscriptions or settings change."""
+        self._notification_sinks_cache_generation += 1
+        self._trigger_id_to_notification_sinks.clear()
+        self._recipient_id_to_notification_sink.clear()
+        self._notification_sink_id_to_time_zone.clear()
@@ -9,7 +9,7 @@ from http_tools.http_server_connector import HttpServerConnector
 logger = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ZabbixHostGroup:
     """ZabbixHostGroup."""
 
@@ -17,7 +17,7 @@ class ZabbixHostGroup:
     name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ZabbixHost:
     """ZabbixHost."""
 
@@ -26,26 +26,26 @@ class ZabbixHost:
     group_ids: frozenset[int]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ZabbixTrigger:
     """ZabbixTrigger."""
 
-    triggerid: str
+    triggerid: int
     description: str
-    priority: str
-    host_id: str
+    priority: int
+    host_id: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ZabbixProblem:
     """ZabbixProblem."""
 
     external_id: str
-    trigger_external_id: str
+    trigger_external_id: int
     trigger_title: str
     opdata: str
-    occurred_at: str
-    trigger_severity: str
+    occurred_at: int
+    trigger_severity: int
 
 
 class ZabbixConnector:
@@ -85,8 +85,8 @@ class ZabbixConnector:
         host_group_external_id_to_host_group = {}
         for host_info in self._parse_answer(answer):
             for group in host_info["groups"]:
-                host_group = ZabbixHostGroup(groupid=group["groupid"], name=group["name"])
-                host_group_external_id_to_host_group[group["groupid"]] = host_group
+                host_group = ZabbixHostGroup(groupid=int(group["groupid"]), name=group["name"])
+                host_group_external_id_to_host_group[host_group.groupid] = host_group
         return list(host_group_external_id_to_host_group.values())
 
     async def get_hosts(self) -> set[ZabbixHost]:
@@ -108,9 +108,9 @@ class ZabbixConnector:
         for host_info in self._parse_answer(answer):
             zabbix_hosts.add(
                 ZabbixHost(
-                    hostid=host_info["hostid"],
+                    hostid=int(host_info["hostid"]),
                     name=host_info["name"],
-                    group_ids=frozenset({group["groupid"] for group in host_info["groups"]})
+                    group_ids=frozenset({int(group["groupid"]) for group in host_info["groups"]})
                 )
             )
         return zabbix_hosts
@@ -136,15 +136,15 @@ class ZabbixConnector:
         for host_info in self._parse_answer(answer):
             zabbix_triggers.add(
                 ZabbixTrigger(
-                    triggerid=host_info["triggerid"],
+                    triggerid=int(host_info["triggerid"]),
                     description=host_info["description"],
-                    priority=host_info["priority"],
-                    host_id=host_info["hosts"][0]["hostid"],
+                    priority=int(host_info["priority"]),
+                    host_id=int(host_info["hosts"][0]["hostid"]),
                 )
             )
         return zabbix_triggers
 
-    async def get_problems(self) -> set[ZabbixProblem]:
+    async def get_problems(self) -> dict[str, ZabbixProblem]:
         """Get Zabbix problems."""
         payload = {
             "jsonrpc": "2.0",
@@ -158,18 +158,17 @@ class ZabbixConnector:
 
         answer = await self._http_connector.post_json(path=self._PATH, payload=payload)
 
-        problems = set()
+        external_id_to_problem = {}
         for problem_info in self._parse_answer(answer):
-            problem = ZabbixProblem(
+            external_id_to_problem[problem_info["eventid"]] = ZabbixProblem(
                 external_id=problem_info["eventid"],
-                trigger_external_id=problem_info["objectid"],
+                trigger_external_id=int(problem_info["objectid"]),
                 trigger_title=problem_info["name"],
                 opdata=problem_info["opdata"],
-                occurred_at=problem_info["clock"],
-                trigger_severity=problem_info["severity"],
+                occurred_at=int(problem_info["clock"]),
+                trigger_severity=int(problem_info["severity"]),
             )
-            problems.add(problem)
-        return problems
+        return external_id_to_problem
 
     @staticmethod
     def _parse_answer(answer: dict[str, Any]) -> list[dict[str, Any]]:
@@ -0,0 +1,26 @@
+"""Module for timing utilities."""
+import functools
+import logging
+import time
+from typing import Awaitable, Callable, ParamSpec, TypeVar
+
+logger = logging.getLogger(__name__)
+
+Params = ParamSpec("Params")
+Result = TypeVar("Result")
+
+
+def timed(coroutine_function: Callable[Params, Awaitable[Result]]) -> Callable[Params, Awaitable[Result]]:
+    """Log coroutine function execution time if debug logging is enabled."""
+    @functools.wraps(coroutine_function)
+    async def wrapper(*args: Params.args, **kwargs: Params.kwargs) -> Result:
+        if not logger.isEnabledFor(logging.DEBUG):
+            return await coroutine_function(*args, **kwargs)
+
+        started_at = time.perf_counter()
+        try:
+            return await coroutine_function(*args, **kwargs)
+        finally:
+            logger.debug(f"{coroutine_function.__qualname__} took {(time.perf_counter() - started_at) * 1000:.1f} ms")
+
+    return wrapper
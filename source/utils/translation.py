@@ -1,4 +1,5 @@
 """Translation module."""
+import functools
 import gettext
 import os
 from enum import StrEnum
@@ -36,6 +37,7 @@ LANGUAGE_CODE_TO_TRANSLATION = {
 }
 
 
+@functools.lru_cache(maxsize=4096)
 def _(text: str, language_code: LanguageCode) -> str:
     """Translate."""
     return LANGUAGE_CODE_TO_TRANSLATION[language_code].gettext(text)
@@ -19,33 +19,60 @@ class TestController(IsolatedAsyncioTestCase):
             ),
         )
 
+    async def test_handle_monitoring_events(self) -> None:
+        with self.subTest("valid"):
+            self.controller.context.database_gateway.get_notification_sinks_by_trigger_ids = AsyncMock(
+                return_value={1: [MagicMock()], 2: []}
+            )
+            self.controller._handle_monitoring_event = AsyncMock(return_value=None)
+
+            await self.controller.handle_monitoring_events(
+                [MagicMock(trigger_id=1), MagicMock(trigger_id=1), MagicMock(trigger_id=2)]
+            )
+
+            self.controller.context.database_gateway.get_notification_sinks_by_trigger_ids.assert_awaited_once_with(
+                {1, 2}
+            )
+            self.assertEqual(self.controller._handle_monitoring_event.await_count, 3)
+
+        with self.subTest("no notifier controller"):
+            self.controller.context.notifier_controller = None
+            self.controller.context.database_gateway.get_notification_sinks_by_trigger_ids = AsyncMock()
+            self.controller._handle_monitoring_event = AsyncMock(return_value=None)
+
+            await self.controller.handle_monitoring_events([MagicMock(trigger_id=1)])
+
+            self.controller.context.database_gateway.get_notification_sinks_by_trigger_ids.assert_not_awaited()
+            self.controller._handle_monitoring_event.assert_not_awaited()
+
     async def test_handle_monitoring_event(self) -> None:
         with self.subTest("raised event"):
-            self.controller.context.database_gateway.get_notification_sinks_by_trigger_id = AsyncMock(
-                return_value=[MagicMock()]
-            )
             self.controller._notify_about_raised_event = AsyncMock(return_value=None)
             self.controller._notify_about_resolved_event = AsyncMock(return_value=None)
 
-            await self.controller._handle_monitoring_event(MagicMock(resolved_at=None))
+            await self.controller._handle_monitoring_event(MagicMock(resolved_at=None), [MagicMock()], MagicMock())
 
-            self.controller.context.database_gateway.get_notification_sinks_by_trigger_id.assert_awaited_once()
             self.controller._notify_about_raised_event.assert_awaited_once()
             self.controller._notify_about_resolved_event.assert_not_awaited()
 
         with self.subTest("resolved event"):
-            self.controller.context.database_gateway.get_notification_sinks_by_trigger_id = AsyncMock(
-                return_value=[MagicMock()]
-            )
             self.controller._notify_about_raised_event = AsyncMock(return_value=None)
             self.controller._notify_about_resolved_event = AsyncMock(return_value=None)
 
-            await self.controller._handle_monitoring_event(MagicMock(resolved_at=42))
+            await self.controller._handle_monitoring_event(MagicMock(resolved_at=42), [MagicMock()], MagicMock())
 
-            self.controller.context.database_gateway.get_notification_sinks_by_trigger_id.assert_awaited_once()
             self.controller._notify_about_raised_event.assert_not_awaited()
             self.controller._notify_about_resolved_event.assert_awaited_once()
 
+        with self.subTest("no notification sinks"):
+            self.controller._notify_about_raised_event = AsyncMock(return_value=None)
+            self.controller._notify_about_resolved_event = AsyncMock(return_value=None)
+
+            await self.controller._handle_monitoring_event(MagicMock(resolved_at=None), [], MagicMock())
+
+            self.controller._notify_about_raised_event.assert_not_awaited()
+            self.controller._notify_about_resolved_event.assert_not_awaited()
+
     async def test_subscribe_to_monitoring_system_triggers(self) -> None:
         with self.subTest("valid"):
             self.controller.context.database_gateway.get_notification_sink = AsyncMock(id=42)
@@ -69,17 +96,15 @@ class TestController(IsolatedAsyncioTestCase):
                     )
                 ]
             )
-            self.controller.context.database_gateway.get_triggers_by_notification_sink_id = AsyncMock(
-                return_value=[
-                    Trigger(id=19208, title='title', severity=2, host_id=10418, disabled_at=None, created_at=1111)
-                ]
+            self.controller.context.database_gateway.insert_missing_notification_sink_to_triggers = AsyncMock(
+                return_value=1
             )
-            self.controller.context.database_gateway.insert = AsyncMock()
 
             triggers_len = await self.controller.subscribe_to_monitoring_system_triggers("42")
 
             self.controller.context.database_gateway.get_notification_sink.assert_awaited_once()
             self.controller.context.monitoring_system_controller.get_triggers.assert_awaited_once()
-            self.controller.context.database_gateway.get_triggers_by_notification_sink_id.assert_awaited_once()
-            self.controller.context.database_gateway.insert.assert_awaited_once()
+            insert_missing = self.controller.context.database_gateway.insert_missing_notification_sink_to_triggers
+            insert_missing.assert_awaited_once()
+            self.assertEqual(insert_missing.await_args.args[1], [19207, 19208])
             self.assertEqual(triggers_len, 1)
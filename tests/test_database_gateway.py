@@ -0,0 +1,115 @@
+import contextlib
+import os
+import sys
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import MagicMock, AsyncMock
+
+sys.path.insert(0, os.path.abspath(os.path.join(__file__, "..", "..", "source")))
+
+from entities.time_zone import TimeZone
+from outer_resources.database_gateway import DatabaseGateway
+
+
+class TestDatabaseGateway(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.database_gateway = DatabaseGateway(
+            context=DatabaseGateway.Context(database_session_maker=MagicMock()),
+        )
+        self.session = MagicMock(execute=AsyncMock())
+
+        @contextlib.asynccontextmanager
+        async def ensure_session():
+            yield self.session
+
+        self.database_gateway.ensure_session = ensure_session
+
+    async def test_get_notification_sinks_by_trigger_ids(self) -> None:
+        with self.subTest("cached"):
+            notification_sink = MagicMock()
+            self.session.execute = AsyncMock(return_value=[(1, notification_sink)])
+
+            first_result = await self.database_gateway.get_notification_sinks_by_trigger_ids({1, 2})
+            second_result = await self.database_gateway.get_notification_sinks_by_trigger_ids({1, 2})
+
+            self.session.execute.assert_awaited_once()
+            self.assertEqual(first_result, {1: [notification_sink], 2: []})
+            self.assertEqual(second_result, first_result)
+
+        with self.subTest("dropped after unsubscription"):
+            self.session.execute = AsyncMock(return_value=[])
+
+            await self.database_gateway.delete_notification_sink_to_trigger_by_id(notification_sink_id=3, trigger_id=1)
+            result = await self.database_gateway.get_notification_sinks_by_trigger_ids({1})
+
+            self.assertEqual(self.session.execute.await_count, 2)
+            self.assertEqual(result, {1: []})
+
+        with self.subTest("not stored when invalidated during fetch"):
+            self.database_gateway._invalidate_notification_sinks_cache()
+
+            async def execute_with_invalidation(_):
+                self.database_gateway._invalidate_notification_sinks_cache()
+                return [(1, notification_sink)]
+
+            self.session.execute = AsyncMock(side_effect=execute_with_invalidation)
+
+            result = await self.database_gateway.get_notification_sinks_by_trigger_ids({1})
+
+            self.assertEqual(result, {1: [notification_sink]})
+            self.assertEqual(self.database_gateway._trigger_id_to_notification_sinks, {})
+
+    async def test_get_notification_sink(self) -> None:
+        with self.subTest("cached"):
+            notification_sink = MagicMock()
+            self.session.execute = AsyncMock(return_value=MagicMock(scalar=MagicMock(return_value=notification_sink)))
+
+            await self.database_gateway.get_notification_sink("42")
+            result = await self.database_gateway.get_notification_sink("42")
+
+            self.session.execute.assert_awaited_once()
+            self.assertIs(result, notification_sink)
+
+        with self.subTest("dropped after time zone update"):
+            await self.database_gateway.update_notification_sink_time_zone_id(notification_sink_id=3, time_zone_id=4)
+
+            self.assertEqual(self.database_gateway._recipient_id_to_notification_sink, {})
+
+        with self.subTest("not stored when invalidated during fetch"):
+            async def execute_with_invalidation(_):
+                self.database_gateway._invalidate_notification_sinks_cache()
+                return MagicMock(scalar=MagicMock(return_value=notification_sink))
+
+            self.session.execute = AsyncMock(side_effect=execute_with_invalidation)
+
+            result = await self.database_gateway.get_notification_sink("42")
+
+            self.assertIs(result, notification_sink)
+            self.assertEqual(self.database_gateway._recipient_id_to_notification_sink, {})
+
+    async def test_get_notification_sink_time_zone(self) -> None:
+        with self.subTest("cached"):
+            time_zone = TimeZone(code="Etc/GMT-14", title="UTC+14")
+            self.session.execute = AsyncMock(return_value=MagicMock(scalar=MagicMock(return_value=time_zone)))
+
+            await self.database_gateway.get_notification_sink_time_zone(3)
+            result = await self.database_gateway.get_notification_sink_time_zone(3)
+
+            self.session.execute.assert_awaited_once()
+            self.assertIs(result, time_zone)
+
+        with self.subTest("dropped after time zone update"):
+            await self.database_gateway.update_notification_sink_time_zone_id(notification_sink_id=3, time_zone_id=4)
+
+            self.assertEqual(self.database_gateway._notification_sink_id_to_time_zone, {})
+
+        with self.subTest("not stored when invalidated during fetch"):
+            async def execute_with_invalidation(_):
+                self.database_gateway._invalidate_notification_sinks_cache()
+                return MagicMock(scalar=MagicMock(return_value=time_zone))
+
+            self.session.execute = AsyncMock(side_effect=execute_with_invalidation)
+
+            result = await self.database_gateway.get_notification_sink_time_zone(3)
+
+            self.assertIs(result, time_zone)
+            self.assertEqual(self.database_gateway._notification_sink_id_to_time_zone, {})
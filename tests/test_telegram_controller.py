@@ -29,7 +29,7 @@ class TestTelegramController(IsolatedAsyncioTestCase):
                 return_value=TimeZone(code="Etc/GMT-14", title="UTC+14")
             )
             self.telegram_controller.context.telegram_bot.send_message = AsyncMock(return_value=None)
-            self.telegram_controller.context.telegram_renderer.render_event_message_text = AsyncMock(
+            self.telegram_controller.context.telegram_renderer.render_event_message_text = MagicMock(
                 return_value="text",
             )
 
@@ -37,7 +37,7 @@ class TestTelegramController(IsolatedAsyncioTestCase):
 
             self.telegram_controller.context.database_gateway.get_notification_sink_time_zone.assert_awaited_once()
             self.telegram_controller.context.telegram_bot.send_message.assert_awaited_once()
-            self.telegram_controller.context.telegram_renderer.render_event_message_text.assert_awaited_once()
+            self.telegram_controller.context.telegram_renderer.render_event_message_text.assert_called_once()
 
     async def test_subscribe_to_monitoring_system(self) -> None:
         with self.subTest("valid"):
@@ -55,3 +55,41 @@ class TestTelegramController(IsolatedAsyncioTestCase):
             self.telegram_controller.context.controller.subscribe_to_monitoring_system_triggers.assert_awaited_once()
             self.telegram_controller.context.telegram_bot.send_message.assert_awaited_once()
             self.telegram_controller.context.database_gateway.get_notification_sink.assert_awaited_once()
+
+    async def test_send_current_problems_answer(self) -> None:
+        max_length = TelegramController.MAX_MESSAGE_LENGTH
+
+        with self.subTest("last part flushed"):
+            send_message = self.telegram_controller.context.telegram_bot.send_message = AsyncMock()
+
+            await self.telegram_controller._send_current_problems_answer("42", ["a" * 4000, "b" * 200])
+
+            self.assertEqual([call.kwargs["text"] for call in send_message.call_args_list], ["a" * 4000, "b" * 200])
+
+        with self.subTest("parts exactly fill message"):
+            send_message = self.telegram_controller.context.telegram_bot.send_message = AsyncMock()
+
+            await self.telegram_controller._send_current_problems_answer("42", ["a" * 4000, "b" * (max_length - 4000)])
+
+            send_message.assert_awaited_once()
+            self.assertEqual(send_message.call_args.kwargs["text"], "a" * 4000 + "b" * (max_length - 4000))
+
+        with self.subTest("parts exceed message by one"):
+            send_message = self.telegram_controller.context.telegram_bot.send_message = AsyncMock()
+
+            await self.telegram_controller._send_current_problems_answer("42", ["a" * 4000, "b" * (max_length - 3999)])
+
+            self.assertEqual(
+                [call.kwargs["text"] for call in send_message.call_args_list],
+                ["a" * 4000, "b" * (max_length - 3999)],
+            )
+
+        with self.subTest("emoji counted as two units"):
+            send_message = self.telegram_controller.context.telegram_bot.send_message = AsyncMock()
+
+            await self.telegram_controller._send_current_problems_answer("42", ["😀" * (max_length // 2), "b"])
+
+            self.assertEqual(
+                [call.kwargs["text"] for call in send_message.call_args_list],
+                ["😀" * (max_length // 2), "b"],
+            )
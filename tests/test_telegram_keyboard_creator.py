@@ -0,0 +1,34 @@
+import os
+import sys
+from unittest import IsolatedAsyncioTestCase
+
+sys.path.insert(0, os.path.abspath(os.path.join(__file__, "..", "..", "source")))
+
+from notifiers.telegram.telegram_keyboard_creator import TelegramButtonAction, TelegramButtonData, cast_button_data
+from utils.translation import LanguageCode
+
+
+class TestTelegramKeyboardCreator(IsolatedAsyncioTestCase):
+    async def test_cast_button_data(self) -> None:
+        for entity_id in (None, 42, -42, LanguageCode.EN):
+            with self.subTest(entity_id=entity_id):
+                button_data = TelegramButtonData(
+                    action=TelegramButtonAction.GO_TO_TRIGGERS,
+                    entity_id=entity_id,
+                    page_number=2,
+                    start_message_id=7,
+                )
+
+                result = cast_button_data(str(button_data))
+
+                self.assertEqual(result, button_data)
+                self.assertEqual(result.entity_id, entity_id)
+
+        with self.subTest("empty attributes"):
+            result = cast_button_data(str(TelegramButtonData(action=TelegramButtonAction.NO_ACTION)))
+
+            self.assertEqual(result, TelegramButtonData(action=TelegramButtonAction.NO_ACTION))
+            self.assertIsNone(result.entity_id)
+            self.assertIsNone(result.mute_code)
+            self.assertIsNone(result.page_number)
+            self.assertIsNone(result.start_message_id)
@@ -72,21 +72,21 @@ class TestZabbixConnector(IsolatedAsyncioTestCase):
             self.assertEqual(
                 zabbix_problems,
                 {
-                    ZabbixProblem(
+                    "660673": ZabbixProblem(
                         external_id="660673",
-                        trigger_external_id="19946",
+                        trigger_external_id=19946,
                         trigger_title="High CPU utilization (over 90% for 5m)",
                         opdata="Current utilization: 90.2669 %",
-                        occurred_at="1670397180",
-                        trigger_severity="2"
+                        occurred_at=1670397180,
+                        trigger_severity=2
                     ),
-                    ZabbixProblem(
+                    "2182049": ZabbixProblem(
                         external_id="2182049",
-                        trigger_external_id="20124",
+                        trigger_external_id=20124,
                         trigger_title="Количество новых записей в camera_status меньше 1000000",
                         opdata="",
-                        occurred_at="1710550081",
-                        trigger_severity="5"
+                        occurred_at=1710550081,
+                        trigger_severity=5
                     )
                 }
             )
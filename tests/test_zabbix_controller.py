@@ -1,13 +1,25 @@
+import asyncio
 import os
 import sys
 from unittest import IsolatedAsyncioTestCase
-from unittest.mock import MagicMock, AsyncMock
+from unittest.mock import MagicMock, AsyncMock, patch
 
 sys.path.insert(0, os.path.abspath(os.path.join(__file__, "..", "..", "source")))
 
 from entities.monitoring_system_structure.trigger import Trigger
 from monitoring_systems.zabbix_controller import ZabbixController
-from outer_resources.zabbix_connector import ZabbixTrigger
+from outer_resources.zabbix_connector import ZabbixProblem, ZabbixTrigger
+
+
+def create_zabbix_problem(external_id: str) -> ZabbixProblem:
+    return ZabbixProblem(
+        external_id=external_id,
+        trigger_external_id=19207,
+        trigger_title="trigger",
+        opdata="",
+        occurred_at=42,
+        trigger_severity=2,
+    )
 
 
 class TestZabbixController(IsolatedAsyncioTestCase):
@@ -22,10 +34,10 @@ class TestZabbixController(IsolatedAsyncioTestCase):
             self.zabbix_controller.context.zabbix_connector.get_triggers = AsyncMock(
                 return_value={
                     ZabbixTrigger(
-                        triggerid='19207',
+                        triggerid=19207,
                         description='/boot: Disk space is low (used > {$VFS.FS.PUSED.MAX.WARN:"/boot"}%)',
-                        priority='2',
-                        host_id='10417',
+                        priority=2,
+                        host_id=10417,
                     )
                 }
             )
@@ -46,3 +58,63 @@ class TestZabbixController(IsolatedAsyncioTestCase):
                     )
                 ]
             )
+
+    async def test_diff_problems(self) -> None:
+        with self.subTest("valid"):
+            kept_problem, raised_problem, resolved_problem = map(create_zabbix_problem, ("1", "2", "3"))
+
+            raised_problems, resolved_problems = self.zabbix_controller._diff_problems(
+                current_cycle_problems={"1": kept_problem, "2": raised_problem},
+                previous_cycle_problems={"1": kept_problem, "3": resolved_problem},
+            )
+
+            self.assertEqual(raised_problems, [raised_problem])
+            self.assertEqual(resolved_problems, [resolved_problem])
+
+    async def test_collect_monitoring_events(self) -> None:
+        with self.subTest("first cycle seeds previous problems"):
+            kept_problem, raised_problem = map(create_zabbix_problem, ("1", "2"))
+            self.zabbix_controller.context.zabbix_connector.get_problems = AsyncMock(
+                side_effect=[{"1": kept_problem}, {"1": kept_problem, "2": raised_problem}]
+            )
+            self.zabbix_controller.context.controller.handle_monitoring_events = AsyncMock(return_value=None)
+
+            with patch.object(asyncio, "sleep", AsyncMock(side_effect=[None, asyncio.CancelledError()])):
+                with self.assertRaises(asyncio.CancelledError):
+                    await self.zabbix_controller._collect_monitoring_events()
+
+            self.zabbix_controller.context.controller.handle_monitoring_events.assert_called_once()
+            self.assertEqual(
+                [
+                    event.external_id
+                    for event in self.zabbix_controller.context.controller.handle_monitoring_events.call_args.args[0]
+                ],
+                ["2"],
+            )
+
+    async def test_dispatch_monitoring_events(self) -> None:
+        with self.subTest("events buffered while handling is running"):
+            handling_finished = asyncio.Event()
+
+            async def wait_for_handling_finish(_) -> None:
+                await handling_finished.wait()
+
+            self.zabbix_controller.context.controller.handle_monitoring_events = AsyncMock(
+                side_effect=wait_for_handling_finish
+            )
+            first_event, second_event, third_event = (MagicMock(), MagicMock(), MagicMock())
+
+            self.zabbix_controller._dispatch_monitoring_events([first_event])
+            first_events_handling_task = self.zabbix_controller._events_handling_task
+            self.zabbix_controller._dispatch_monitoring_events([second_event])
+            self.zabbix_controller._dispatch_monitoring_events([third_event])
+
+            self.zabbix_controller.context.controller.handle_monitoring_events.assert_called_once_with([first_event])
+            handling_finished.set()
+            await first_events_handling_task
+            self.assertEqual(
+                self.zabbix_controller.context.controller.handle_monitoring_events.call_args.args[0],
+                [second_event, third_event],
+            )
+            await self.zabbix_controller._events_handling_task
+            self.assertIsNone(self.zabbix_controller._events_handling_task)